@@ -0,0 +1,47 @@
+"""
+Homology-constrained path planning on triangulated grids.
+
+The public names below are resolved on first access (PEP 562), so ``import homopath`` is cheap:
+a module, and whatever SciPy, matplotlib or solver backend it needs, is only imported when one of
+its names is used
+"""
+import importlib
+
+_EXPORTS = {
+    "GridBuilder": "grid",
+    "load_occupancy": "grid",
+    "dilate": "grid",
+    "label_holes": "grid",
+    "GridComplex": "cellcomplex",
+    "Model": "optimizer",
+    "PathProblem": "optimizer",
+    "Model1": "optimizer1",
+    "PathParser": "pathparser",
+    "Plotter": "plotter",
+    "HomologyCover": "fields",
+    "flow_incidence": "flowlp",
+    "solve_lp": "flowlp",
+    "solve_master": "flowlp",
+    "MultiResolutionPlanner": "multires",
+    "winding_angles": "multires",
+    "ray_crossings": "multires",
+    "MultiAgentPlanner": "multiagent",
+    "SolutionCache": "cache",
+    "PlanningService": "server",
+    "make_server": "server",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,28 @@
+import importlib
+
+
+class LazyModule:
+    """
+    Stand-in for a module, or one attribute of it, that is only imported on first attribute
+    access. Solver backends are bound this way so that importing a module that can use them
+    costs nothing until a solve runs, and nodes without the backend can still import it
+    """
+
+    def __init__(self, name, attr = None):
+        self._name = name
+        self._attr = attr
+        self._target = None
+
+    def _load(self):
+        if self._target is None:
+            target = importlib.import_module(self._name)
+            self._target = getattr(target, self._attr) if self._attr else target
+        return self._target
+
+    def __getattr__(self, item):
+        return getattr(self._load(), item)
+
+    def __repr__(self):
+        name = self._name if self._attr is None else f"{self._name}.{self._attr}"
+        state = "loaded" if self._target is not None else "not loaded"
+        return f"<lazy {name} ({state})>"
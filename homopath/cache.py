@@ -0,0 +1,111 @@
+import hashlib
+import os
+import pickle
+import tempfile
+import threading
+from collections import OrderedDict
+
+
+class SolutionCache:
+    """
+    Memoizes Model solves. Two reference paths between the same endpoints on the same map give the
+    same optimum exactly when they are homologous, so results are keyed on the map signature, the
+    solver method, (s, t) and the integer winding vector of the reference path rather than on the
+    path itself. An in-memory LRU tier sits in front of an optional on-disk tier (one pickle per key)
+    """
+
+    def __init__(self, maxsize = 1024, directory = None):
+        self.maxsize = maxsize
+        self.directory = directory
+        if directory is not None:
+            os.makedirs(directory, exist_ok = True)
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(model, ref_path, method = "solveflow", tol = 1e-3, **options):
+        """
+        (map signature, method, s, t, winding vector, tol, sorted options) for a query. s and t are
+        the endpoints of ref_path even for Model.solve, which routes between the first and last
+        vertex but still takes the reference class from ref_path's own endpoints
+        """
+        winding = tuple(model._check_path(ref_path).tolist())
+        return (model.grid.signature(), method, int(ref_path[0]), int(ref_path[-1]), winding, tol,
+                tuple(sorted(options.items())))
+
+    def _path(self, key):
+        return os.path.join(self.directory, hashlib.sha1(repr(key).encode()).hexdigest() + ".pkl")
+
+    def get(self, key, default = None):
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+        if self.directory is not None:
+            try:
+                with open(self._path(key), "rb") as fh:
+                    value = pickle.load(fh)
+            except FileNotFoundError:
+                pass
+            else:
+                with self._lock:
+                    self.disk_hits += 1
+                self._remember(key, value)
+                return value
+        with self._lock:
+            self.misses += 1
+        return default
+
+    def put(self, key, value):
+        self._remember(key, value)
+        if self.directory is not None:
+            fd, tmp = tempfile.mkstemp(dir = self.directory, suffix = ".tmp")
+            with os.fdopen(fd, "wb") as fh:
+                pickle.dump(value, fh)
+            os.replace(tmp, self._path(key))
+
+    def _remember(self, key, value):
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last = False)
+
+    def solve(self, model, ref_path, method = "solveflow", tol = 1e-3, env = None, solver = None, **kwargs):
+        """
+        Cached call of model.<method>(ref_path, tol, env = env, **kwargs). kwargs such as homology
+        are part of the key; env is the gurobipy environment to solve in and is not. A miss is computed
+        with solver(ref_path, tol) instead when given, e.g. the solve of a PathProblem for the same
+        method and kwargs. Infeasible results (None) are cached too. The returned tuple is shared
+        between hits, so treat it as read-only
+        """
+        key = self.key(model, ref_path, method, tol, **kwargs)
+        missing = object()
+        result = self.get(key, missing)
+        if result is missing:
+            if solver is not None:
+                result = solver(ref_path, tol)
+            else:
+                result = getattr(model, method)(ref_path, tol, env = env, **kwargs)
+            self.put(key, result)
+        return result
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.disk_hits + self.misses
+            return {"hits": self.hits, "disk_hits": self.disk_hits, "misses": self.misses,
+                    "hit_rate": (self.hits + self.disk_hits) / lookups if lookups else None,
+                    "entries": len(self._entries)}
+
+    def clear(self):
+        """Drop the in-memory tier and reset the counters (the disk tier is kept)"""
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.disk_hits = self.misses = 0
+
+    def __len__(self):
+        return len(self._entries)
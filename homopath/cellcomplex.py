@@ -0,0 +1,200 @@
+import sys
+
+import numpy as np
+
+# Neighbour steps (di, dj) in the order edges are listed for every vertex: up, right, and the
+# two upward diagonals, which only odd-parity vertices (i + j odd) own
+STEPS = ((0, 1), (1, 0), (-1, 1), (1, 1))
+STEP_COSTS = np.array([1.0, 1.0, np.sqrt(2), np.sqrt(2)], dtype = np.float32)
+
+
+def deep_getsizeof(obj, seen = None):
+    """Bytes held by a container of tuples/lists/dicts/ints, counting every object once"""
+    if seen is None:
+        seen = set()
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        size += sum(deep_getsizeof(k, seen) + deep_getsizeof(v, seen) for k, v in obj.items())
+    elif isinstance(obj, (list, tuple)):
+        size += sum(deep_getsizeof(x, seen) for x in obj)
+    return size
+
+
+class GridComplex:
+    """
+    Compact triangulated grid: contiguous int32 vertex, edge and triangle arrays and float32 edge
+    costs. A vertex ID is j * cols + i, so IDs and (i, j) coordinates convert by arithmetic.
+    The list/dict views the LP code works with are built on first access and then kept
+    """
+
+    __slots__ = ("rows", "cols", "vertices", "edges", "edge_steps", "costs", "_triangles",
+                 "_vertex_list", "_vert_dict", "_reverse_vdict", "_edge_list", "_edge_index",
+                 "_triangle_list", "_cost_dict")
+
+    def __init__(self, rows, cols, vertices, edges, edge_steps):
+        self.rows = rows
+        self.cols = cols
+        self.vertices = np.ascontiguousarray(vertices, dtype = np.int32)
+        self.edges = np.ascontiguousarray(edges, dtype = np.int32)
+        self.edge_steps = np.ascontiguousarray(edge_steps, dtype = np.int8)
+        self.costs = STEP_COSTS[self.edge_steps]
+        self._triangles = None
+        self._vertex_list = None
+        self._vert_dict = None
+        self._reverse_vdict = None
+        self._edge_list = None
+        self._edge_index = None
+        self._triangle_list = None
+        self._cost_dict = None
+
+    @classmethod
+    def from_masks(cls, removed, blocked):
+        """
+        Vertices are the cells not in ``removed``; edges join neighbouring cells that are both
+        outside ``blocked``, listed per vertex in STEPS order
+        """
+        rows, cols = blocked.shape
+        free = ~blocked
+        jj, ii = np.indices((rows, cols), dtype = np.int32)
+        odd = (ii + jj) % 2 == 1
+        valid = np.zeros((rows, cols, len(STEPS)), dtype = bool)
+        for k, (di, dj) in enumerate(STEPS):
+            ti, tj = ii + di, jj + dj
+            inside = (ti >= 0) & (ti < cols) & (tj < rows)
+            ok = inside & free
+            ok[inside] &= free[tj[inside], ti[inside]]
+            if k >= 2:
+                ok &= odd
+            valid[..., k] = ok
+        j, i, k = np.nonzero(valid)
+        src = (j * cols + i).astype(np.int32)
+        offsets = np.array([dj * cols + di for (di, dj) in STEPS], dtype = np.int32)
+        edges = np.stack([src, src + offsets[k]], axis = 1)
+        vertices = np.flatnonzero(~removed.ravel())
+        return cls(rows, cols, vertices, edges, k)
+
+    def vertex_id(self, i, j):
+        """Vertex ID of (i, j); works elementwise on arrays"""
+        return j * self.cols + i
+
+    def coords(self, v):
+        """(i, j) of a vertex ID; works elementwise on arrays"""
+        j, i = divmod(v, self.cols)
+        return i, j
+
+    @property
+    def triangles(self):
+        """(t, 3) array of counter-clockwise triangles, in the order the edge scan finds them"""
+        if self._triangles is None:
+            E = self.edges
+            # out[v, k] is the node reached from v along STEPS[k], or -1 without such an edge.
+            # Scanning it in slot order reproduces the order edges are listed in
+            out = np.full((self.rows * self.cols, len(STEPS)), -1, dtype = np.int32)
+            out[E[:, 0], self.edge_steps] = E[:, 1]
+
+            u, v = E[:, 0], E[:, 1]
+            w = out[v]
+            closes = (w >= 0) & (out[u][:, None, :] == w[:, :, None]).any(axis = 2)
+            e_idx, k = np.nonzero(closes)
+            u, v, w = u[e_idx], v[e_idx], w[e_idx, k]
+
+            (ui, uj), (vi, vj), (wi, wj) = self.coords(u), self.coords(v), self.coords(w)
+            ccw = (vi - ui) * (wj - uj) - (vj - uj) * (wi - ui) > 0
+            self._triangles = np.stack([u, np.where(ccw, v, w), np.where(ccw, w, v)], axis = 1)
+        return self._triangles
+
+    @property
+    def nbytes(self):
+        """Bytes held by the compact arrays"""
+        arrays = [self.vertices, self.edges, self.edge_steps, self.costs]
+        if self._triangles is not None:
+            arrays.append(self._triangles)
+        return sum(a.nbytes for a in arrays)
+
+    # Compatibility views. The _make_* builders return fresh objects; the properties keep them
+
+    def _make_vertex_list(self):
+        return self.vertices.tolist()
+
+    def _make_vert_dict(self, vertex_list):
+        i, j = self.coords(self.vertices)
+        return dict(zip(zip(i.tolist(), j.tolist()), vertex_list))
+
+    def _make_edge_list(self):
+        return list(map(tuple, self.edges.tolist()))
+
+    def _make_triangle_list(self):
+        return list(map(tuple, self.triangles.tolist()))
+
+    def _make_cost_dict(self, edge_list):
+        costs = self.costs.tolist()
+        cost = dict(zip(edge_list, costs))
+        cost.update(zip(((b, a) for (a, b) in edge_list), costs))
+        return cost
+
+    @property
+    def vertex_list(self):
+        if self._vertex_list is None:
+            self._vertex_list = self._make_vertex_list()
+        return self._vertex_list
+
+    @property
+    def vert_dict(self):
+        """{(i, j): vertex ID}"""
+        if self._vert_dict is None:
+            self._vert_dict = self._make_vert_dict(self.vertex_list)
+        return self._vert_dict
+
+    @property
+    def reverse_vdict(self):
+        """{vertex ID: (i, j)}"""
+        if self._reverse_vdict is None:
+            self._reverse_vdict = {v: k for k, v in self.vert_dict.items()}
+        return self._reverse_vdict
+
+    @property
+    def edge_list(self):
+        if self._edge_list is None:
+            self._edge_list = self._make_edge_list()
+        return self._edge_list
+
+    @property
+    def edge_index(self):
+        """{(from_node, to_node): position in edge_list}"""
+        if self._edge_index is None:
+            self._edge_index = {e: i for i, e in enumerate(self.edge_list)}
+        return self._edge_index
+
+    @property
+    def triangle_list(self):
+        if self._triangle_list is None:
+            self._triangle_list = self._make_triangle_list()
+        return self._triangle_list
+
+    @property
+    def cost_dict(self):
+        """{(a, b): cost} holding both directions of every edge"""
+        if self._cost_dict is None:
+            self._cost_dict = self._make_cost_dict(self.edge_list)
+        return self._cost_dict
+
+    def footprint(self):
+        """
+        Memory of the compact arrays against the tuple/dict representation (vertex list, vert_dict and
+        its reverse, edge list, triangle list and the two-way cost dict). The latter is measured on
+        temporary copies, so the complex keeps only the views it had before
+
+        Output: dict with both byte counts and bytes per edge
+        """
+        compact = self.nbytes if self._triangles is not None else self.nbytes + self.triangles.nbytes
+        vertex_list = self._make_vertex_list()
+        vert_dict = self._make_vert_dict(vertex_list)
+        edge_list = self._make_edge_list()
+        legacy = deep_getsizeof([vertex_list, vert_dict, {v: k for k, v in vert_dict.items()}, edge_list,
+                                 self._make_triangle_list(), self._make_cost_dict(edge_list)])
+        m = max(len(self.edges), 1)
+        return {"compact": compact, "legacy": legacy, "compact_per_edge": compact / m,
+                "legacy_per_edge": legacy / m, "reduction": legacy / compact}
@@ -0,0 +1,166 @@
+import numpy as np
+from scipy import sparse
+from scipy.sparse.csgraph import dijkstra
+
+
+class HomologyCover:
+    """
+    Finite cover of a grid graph: one copy of every vertex per winding vector w with |w_h| <= max_winding,
+    where w counts signed crossings of each hole's cut ray (GridBuilder.cut_cocycles). Moving along an
+    edge adds that edge's crossings to w, so a shortest path in the cover from (s, 0) to (g, w) is a
+    shortest s-g path in the homology class labelled w. One Dijkstra sweep from (s, 0) therefore gives
+    the cost to every vertex in every class with bounded winding
+    """
+
+    def __init__(self, grid, max_winding = 1, holes = None, max_nodes = 20_000_000):
+        """
+        holes: indices (into grid.holes) of the holes whose winding the cover tracks, all by default.
+               Paths may wind freely around the others, so fewer holes give a coarser but smaller cover
+        max_nodes: bound on classes x vertices; the cover has (2 max_winding + 1)^holes classes, so a
+                   larger one raises ValueError before anything is allocated
+        """
+        self.grid = grid
+        self.complex = grid.complex()
+        self.max_winding = max_winding
+        self.holes = np.arange(len(grid.holes)) if holes is None else np.asarray(holes, dtype = int).ravel()
+        if ((self.holes < 0) | (self.holes >= len(grid.holes))).any():
+            raise ValueError(f"Hole indices {self.holes.tolist()} are not all in range(0, {len(grid.holes)})")
+        self.n_holes = len(self.holes)
+        self.base = 2 * max_winding + 1
+        V = self.complex.vertices
+        self.n = len(V)
+        # Python integers, so that the check itself cannot overflow
+        n_classes = self.base ** self.n_holes
+        if n_classes * self.n > max_nodes:
+            raise ValueError(f"HomologyCover would have {self.base}^{self.n_holes} = {n_classes} classes of "
+                             f"{self.n} vertices, more than max_nodes = {max_nodes}; track fewer holes or "
+                             f"lower max_winding")
+        self.n_classes = n_classes
+        # windings[c] is the winding vector of class c (mixed radix, hole 0 least significant)
+        self._radix = self.base ** np.arange(self.n_holes, dtype = np.int64)
+        c = np.arange(self.n_classes)[:, None]
+        self.windings = (c // self._radix) % self.base - max_winding
+        self._pos = np.searchsorted(V, self.complex.edges)
+        self._structure = None
+        self._graph = None
+
+    def class_index(self, winding):
+        """Class index of a winding vector (or an (k, n_holes) array of them) over the tracked holes"""
+        w = np.asarray(winding) + self.max_winding
+        return (w * self._radix).sum(axis = -1)
+
+    def winding_of(self, path):
+        """Winding vector (cut crossings of the tracked holes) of a path given as a list of vertex IDs"""
+        return self.grid.winding_of(path)[self.holes]
+
+    def _arcs(self):
+        """
+        CSR structure of the cover (indptr, indices) and the edge index behind every arc, built once:
+        the arcs only depend on the grid and the winding bound, so new weights are a single gather
+        """
+        if self._structure is None:
+            a, b = self._pos[:, 0], self._pos[:, 1]
+            n, K = self.n, self.n_classes
+            C = self.grid.cut_cocycles()[:, self.holes].tocsr()
+            crossing = np.diff(C.indptr) > 0
+            offset = (n * np.arange(K))[:, None]
+
+            # Edges that cross no cut keep the class
+            keep = np.flatnonzero(~crossing)
+            src = [(a[keep] + offset).ravel(), (b[keep] + offset).ravel()]
+            dst = [(b[keep] + offset).ravel(), (a[keep] + offset).ravel()]
+            edge = [np.tile(keep, K), np.tile(keep, K)]
+
+            # Edges that cross cuts move between classes, and drop out where |w_h| would exceed the bound
+            idx = np.flatnonzero(crossing)
+            D = C[idx].toarray()
+            for sign, tail, head in ((1, a[idx], b[idx]), (-1, b[idx], a[idx])):
+                moved = self.windings[None, :, :] + sign * D[:, None, :]
+                ok = (np.abs(moved) <= self.max_winding).all(axis = 2)
+                e, k = np.nonzero(ok)
+                src.append(tail[e] + n * k)
+                dst.append(head[e] + n * self.class_index(moved[e, k]))
+                edge.append(idx[e])
+
+            src, dst, edge = np.concatenate(src), np.concatenate(dst), np.concatenate(edge)
+            order = np.lexsort((dst, src))
+            indptr = np.zeros(n * K + 1, dtype = np.int64)
+            np.cumsum(np.bincount(src, minlength = n * K), out = indptr[1:])
+            self._structure = (indptr, dst[order], edge[order])
+        return self._structure
+
+    def graph(self, weights = None):
+        """
+        Sparse adjacency of the cover (node = class * n + vertex position) under per-edge weights,
+        the edge costs by default. The arc structure is shared by every call and the default graph is
+        kept, so repeated searches under new weights do not rebuild the cover
+        """
+        if weights is None and self._graph is not None:
+            return self._graph
+        w = self.complex.costs if weights is None else np.asarray(weights)
+        indptr, indices, edge = self._arcs()
+        N = self.n * self.n_classes
+        G = sparse.csr_matrix((w[edge], indices, indptr), shape = (N, N))
+        if weights is None:
+            self._graph = G
+        return G
+
+    def shortest_paths(self, source, weights = None, return_predecessors = False):
+        """
+        Dijkstra from (source, zero winding) over the cover.
+
+        Output: (K, n) array of costs (inf where unreachable) and, if requested, the (K, n)
+                predecessor array in cover node numbering
+        """
+        start = self._node(source, np.zeros(self.n_holes, dtype = int))
+        result = dijkstra(self.graph(weights), directed = True, indices = start,
+                          return_predecessors = return_predecessors)
+        if return_predecessors:
+            dist, pred = result
+            return dist.reshape(self.n_classes, self.n), pred.reshape(self.n_classes, self.n)
+        return result.reshape(self.n_classes, self.n)
+
+    def _node(self, v, winding):
+        return int(self.class_index(winding)) * self.n + int(np.searchsorted(self.complex.vertices, v))
+
+    def path(self, pred, source, goal, winding):
+        """
+        Rebuild the vertex ID path from source to goal in the class with this winding, from the
+        predecessors returned by shortest_paths(source, return_predecessors = True). None if unreachable
+        """
+        V = self.complex.vertices
+        node = self._node(goal, winding)
+        flat = pred.ravel()
+        if flat[node] < 0 and node != self._node(source, np.zeros(self.n_holes, dtype = int)):
+            return None
+        path = []
+        while node >= 0:
+            path.append(int(V[node % self.n]))
+            node = flat[node]
+        path.reverse()
+        return path
+
+    def field(self, source, out = None):
+        """
+        Minimal cost from source to every vertex, per winding class, in one sweep.
+
+        out: optional .npy path; the field is then written to a memory-mapped file that can be
+             reopened with np.load(out, mmap_mode = "r")
+        Output: (K, rows, cols) float32 array, field[c][j, i] being the cost to (i, j) in class
+                self.windings[c] (inf for blocked or unreachable cells)
+        """
+        dist = self.shortest_paths(source)
+        shape = (self.n_classes, self.grid.rows, self.grid.cols)
+        if out is None:
+            field = np.full(shape, np.inf, dtype = np.float32)
+        else:
+            field = np.lib.format.open_memmap(out, mode = "w+", dtype = np.float32, shape = shape)
+            field[:] = np.inf
+        field.reshape(self.n_classes, -1)[:, self.complex.vertices] = dist
+        if out is not None:
+            field.flush()
+        return field
+
+    def reachable(self, field):
+        """Indices of the classes that reach at least one vertex"""
+        return np.flatnonzero(np.isfinite(field.reshape(self.n_classes, -1)).any(axis = 1))
@@ -0,0 +1,95 @@
+import numpy as np
+from scipy import sparse
+
+
+def flow_incidence(n_nodes, edges):
+    """
+    Node-arc incidence matrix for E_full = E + reversed(E), so that (A @ x)[v] = outflow - inflow.
+
+    edges: (m, 2) array of node positions in 0..n_nodes-1
+    Output: sparse (n_nodes, 2m) matrix
+    """
+    m = len(edges)
+    tails = np.concatenate([edges[:, 0], edges[:, 1]])
+    heads = np.concatenate([edges[:, 1], edges[:, 0]])
+    arcs = np.arange(2 * m)
+    data = np.concatenate([np.ones(2 * m), -np.ones(2 * m)])
+    return sparse.csr_matrix((data, (np.concatenate([tails, heads]), np.concatenate([arcs, arcs]))),
+                             shape = (n_nodes, 2 * m))
+
+
+def solve_lp(c, A_eq, b_eq, ub = 1.0, backend = "gurobi", name = "flow_lp"):
+    """
+    Solve min c @ x subject to A_eq @ x == b_eq, 0 <= x <= ub.
+
+    backend: "gurobi" (matrix API) or "highs" (scipy.optimize.linprog)
+    Output: (x, objective), or None when no optimal solution is found
+    """
+    if backend == "gurobi":
+        import gurobipy as gp
+        from gurobipy import GRB
+
+        m = gp.Model(name)
+        x = m.addMVar(len(c), lb = 0.0, ub = ub, name = "x")
+        m.setObjective(c @ x, GRB.MINIMIZE)
+        m.addConstr(sparse.csr_matrix(A_eq) @ x == b_eq, name = "eq")
+        m.optimize()
+        if m.status != GRB.OPTIMAL:
+            return None
+        return x.X, m.objVal
+
+    if backend == "highs":
+        from scipy.optimize import linprog
+
+        res = linprog(c, A_eq = A_eq, b_eq = b_eq, bounds = (0.0, ub), method = "highs")
+        if res.status != 0:
+            return None
+        return res.x, res.fun
+
+    raise ValueError(f"Unknown LP backend {backend!r}")
+
+
+def solve_master(c, A_ub, b_ub, A_eq, b_eq, integer = False, backend = "gurobi", name = "master"):
+    """
+    Solve min c @ x subject to A_ub @ x <= b_ub, A_eq @ x == b_eq, x >= 0, with x binary when
+    integer is set. Column generation masters use the duals of the LP.
+
+    backend: "gurobi" (matrix API) or "highs" (scipy.optimize.linprog / milp)
+    Output: (x, objective, duals_ub, duals_eq), the duals being None for integer solves, or None
+            when no optimal solution is found
+    """
+    if backend == "gurobi":
+        import gurobipy as gp
+        from gurobipy import GRB
+
+        m = gp.Model(name)
+        x = m.addMVar(len(c), lb = 0.0, ub = 1.0 if integer else GRB.INFINITY,
+                      vtype = GRB.BINARY if integer else GRB.CONTINUOUS, name = "x")
+        m.setObjective(c @ x, GRB.MINIMIZE)
+        ub = m.addConstr(sparse.csr_matrix(A_ub) @ x <= b_ub, name = "ub")
+        eq = m.addConstr(sparse.csr_matrix(A_eq) @ x == b_eq, name = "eq")
+        m.optimize()
+        if m.status != GRB.OPTIMAL:
+            return None
+        if integer:
+            return x.X, m.objVal, None, None
+        return x.X, m.objVal, ub.Pi, eq.Pi
+
+    if backend == "highs":
+        if integer:
+            from scipy.optimize import Bounds, LinearConstraint, milp
+
+            res = milp(c, integrality = np.ones(len(c)), bounds = Bounds(0.0, 1.0),
+                       constraints = [LinearConstraint(A_ub, -np.inf, b_ub), LinearConstraint(A_eq, b_eq, b_eq)])
+            if res.status != 0:
+                return None
+            return res.x, res.fun, None, None
+
+        from scipy.optimize import linprog
+
+        res = linprog(c, A_ub = A_ub, b_ub = b_ub, A_eq = A_eq, b_eq = b_eq, bounds = (0.0, None), method = "highs")
+        if res.status != 0:
+            return None
+        return res.x, res.fun, res.ineqlin.marginals, res.eqlin.marginals
+
+    raise ValueError(f"Unknown LP backend {backend!r}")
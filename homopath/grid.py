@@ -0,0 +1,263 @@
+import hashlib
+
+import numpy as np
+
+from ._lazy import LazyModule
+from .cellcomplex import GridComplex
+
+# Building the complex needs only numpy; scipy.sparse is loaded once a sparse matrix is requested
+sparse = LazyModule("scipy.sparse")
+
+
+def load_occupancy(path, threshold = 0.5):
+    """
+    Read an occupancy raster. ``.npy`` files are taken as boolean arrays indexed [j, i];
+    images are converted to grey levels, dark pixels (< threshold) are occupied, and the
+    rows are flipped so the picture keeps its orientation with j pointing up
+    """
+    if str(path).endswith(".npy"):
+        return np.load(path).astype(bool)
+    from matplotlib.image import imread
+    img = np.asarray(imread(path), dtype = float)
+    if img.ndim == 3:
+        img = img[..., :3].mean(axis = 2)
+    if img.max() > 1.0:
+        img = img / 255.0
+    return np.flipud(img < threshold)
+
+
+def dilate(mask, radius):
+    """Grow a boolean mask by ``radius`` cells in every direction (square structuring element)"""
+    if radius <= 0:
+        return mask.copy()
+    # The square element is separable: OR the shifted copies along the columns, then the rows
+    rows, cols = mask.shape
+    size = 2 * radius + 1
+    padded = np.pad(mask, radius)
+    wide = np.zeros((rows + 2 * radius, cols), dtype = bool)
+    for d in range(size):
+        wide |= padded[:, d:d + cols]
+    out = np.zeros((rows, cols), dtype = bool)
+    for d in range(size):
+        out |= wide[d:d + rows]
+    return out
+
+
+def label_holes(blocked):
+    """
+    Label connected obstacles of a blocked mask the way the triangulated grid sees them.
+    Cells are joined through shared sides and through the diagonal of their square when the
+    grid draws that diagonal. Obstacles touching the border are part of the outer boundary
+    and get label 0.
+
+    Output: (labels, holes) where labels[j, i] is the 1-based hole index and holes holds one
+            blocked (i, j) cell per hole
+    """
+    from scipy.sparse.csgraph import connected_components
+
+    rows, cols = blocked.shape
+    idx = np.arange(rows * cols).reshape(rows, cols)
+    odd = (np.add.outer(np.arange(rows), np.arange(cols)) % 2).astype(bool)
+
+    pairs = [
+        (idx[:, :-1], idx[:, 1:], blocked[:, :-1] & blocked[:, 1:]),
+        (idx[:-1, :], idx[1:, :], blocked[:-1, :] & blocked[1:, :]),
+        (idx[:-1, :-1], idx[1:, 1:], blocked[:-1, :-1] & blocked[1:, 1:] & odd[:-1, :-1]),
+        (idx[:-1, 1:], idx[1:, :-1], blocked[:-1, 1:] & blocked[1:, :-1] & ~odd[:-1, :-1]),
+    ]
+    src = np.concatenate([a[m] for a, _, m in pairs])
+    dst = np.concatenate([b[m] for _, b, m in pairs])
+    graph = sparse.csr_matrix((np.ones(len(src), dtype = np.int8), (src, dst)), shape = (rows * cols, rows * cols))
+    _, comp = connected_components(graph, directed = False)
+    comp = comp.reshape(rows, cols)
+
+    border = np.zeros_like(blocked)
+    border[0, :] = border[-1, :] = border[:, 0] = border[:, -1] = True
+    outer = np.unique(comp[blocked & border])
+    inner = blocked & ~np.isin(comp, outer)
+
+    hole_ids, first = np.unique(comp[inner], return_index = True)
+    labels = np.zeros((rows, cols), dtype = np.int32)
+    labels[inner] = np.searchsorted(hole_ids, comp[inner]) + 1
+    flat = idx[inner][first]
+    holes = [(int(f % cols), int(f // cols)) for f in flat]
+    return labels, holes
+
+
+class GridBuilder:
+    """
+    This class instantiates grid objects. Each grid object has some rows, columns and may have holes in it.
+    Holes are either given as a list of (i, j) centre points, or as a boolean occupancy array indexed
+    [j, i] whose connected obstacles become the holes
+    """
+
+    def __init__(self, rows, cols, holes = [], occupancy = None, dilation = 1):
+        """Initialize a grid object"""
+        self.dilation = dilation
+        if occupancy is None:
+            self.rows = rows
+            self.cols = cols
+            self.holes = holes
+            self.occupancy = None
+            # Hole centres lose their vertex; the dilated ring around them only loses its edges
+            centres = np.zeros((rows, cols), dtype = bool)
+            for (i, j) in holes:
+                if not (0 <= i < cols and 0 <= j < rows):
+                    raise ValueError(f"Hole {(i, j)} is outside the {rows} x {cols} grid")
+                centres[j, i] = True
+            self._removed = centres
+            self.blocked = dilate(centres, dilation)
+        else:
+            self.occupancy = np.asarray(occupancy, dtype = bool)
+            self.rows, self.cols = self.occupancy.shape
+            self.blocked = dilate(self.occupancy, dilation)
+            self._removed = self.blocked
+            self.hole_labels, self.holes = label_holes(self.blocked)
+        self._complex = None
+        self._cocycles = None
+        self._signature = None
+
+    @classmethod
+    def from_image(cls, path, threshold = 0.5, dilation = 1):
+        """Build a grid from an occupancy image or .npy file (see load_occupancy)"""
+        return cls(None, None, occupancy = load_occupancy(path, threshold), dilation = dilation)
+
+    def signature(self):
+        """Hex digest identifying the map: size, removed vertices and blocked cells"""
+        if self._signature is None:
+            digest = hashlib.sha1(f"{self.rows}x{self.cols}".encode())
+            digest.update(np.packbits(self._removed).tobytes())
+            digest.update(np.packbits(self.blocked).tobytes())
+            self._signature = digest.hexdigest()
+        return self._signature
+
+    def complex(self):
+        """The compact GridComplex for this grid, built once"""
+        if self._complex is None:
+            self._complex = GridComplex.from_masks(self._removed, self.blocked)
+        return self._complex
+
+    def vertex_array(self):
+        """Sorted int32 array of vertex IDs (j * cols + i) that are not removed"""
+        return self.complex().vertices
+
+    def edge_array(self):
+        """(m, 2) int32 array of edges (from_node, to_node), in the same order as get_edges"""
+        return self.complex().edges
+
+    def edge_costs(self):
+        """Length of every edge in edge_array order: 1 for horizontal/vertical edges, sqrt(2) for diagonals"""
+        return self.complex().costs
+
+    def triangle_array(self):
+        """(t, 3) int32 array of counter-clockwise triangles, in the same order as generate_triangles"""
+        return self.complex().triangles
+
+    def get_vertices(self):
+        """ Create a list of vertices with unique signatures (node IDs) for the grid. Accounts for holes
+
+            Output: A list of indices, one for each vertex"""
+        return self.complex().vertex_list, self.complex().vert_dict
+
+    def get_edges(self):
+        """ Create a list of edges between nodes in the grid. Horizontal, vertical and diagonal edges
+
+            Output: A list of edges. Each element is of the form (from_node, to_node)"""
+        return self.complex().edge_list
+
+    def generate_triangles(self):
+        """
+        Generate triangles from edges in the grid.
+
+        Returns: A list of tuples, each representing a triangle as three nodes
+        """
+        return self.complex().triangle_list
+
+    def cut_cocycles(self):
+        """
+        Integral cocycle generators, one per hole: the edges crossing a vertical cut ray that runs
+        from the hole cell (i, j) down to the bottom boundary along x = i + 0.5. An edge crossing
+        the ray left to right counts +1, right to left -1, so C.T @ x counts how often a flow x
+        winds past each hole
+
+        Output: sparse (m, len(holes)) int32 matrix C
+        """
+        if self._cocycles is None:
+            cx = self.complex()
+            E = cx.edges
+            cols = self.cols
+            slot = np.full((self.rows * cols, 4), -1, dtype = np.int32)
+            slot[E[:, 0], cx.edge_steps] = np.arange(len(E), dtype = np.int32)
+
+            edge_idx, hole_idx, signs = [], [], []
+            for h, (i, j) in enumerate(self.holes):
+                below = np.arange(j) * cols + i
+                # Horizontal edges (i, y) -> (i + 1, y), then the diagonal of each square (i, y):
+                # odd squares own (i, y) -> (i + 1, y + 1), even ones (i + 1, y) -> (i, y + 1)
+                odd = (i + np.arange(j)) % 2 == 1
+                found = np.concatenate([slot[below, 1], np.where(odd, slot[below, 3], slot[below + 1, 2])])
+                sign = np.concatenate([np.ones(j, dtype = np.int32), np.where(odd, 1, -1)])
+                keep = found >= 0
+                edge_idx.append(found[keep])
+                signs.append(sign[keep])
+                hole_idx.append(np.full(keep.sum(), h))
+            if edge_idx:
+                data = (np.concatenate(signs), (np.concatenate(edge_idx), np.concatenate(hole_idx)))
+            else:
+                data = (np.zeros(0, dtype = np.int32), (np.zeros(0, dtype = int), np.zeros(0, dtype = int)))
+            self._cocycles = sparse.csr_matrix(data, shape = (len(E), len(self.holes)), dtype = np.int32)
+        return self._cocycles
+
+    def winding_of(self, path):
+        """Signed cut crossings of a path given as a list of vertex IDs, one integer per hole"""
+        index = self.complex().edge_index
+        C = self.cut_cocycles()
+        winding = np.zeros(len(self.holes), dtype = int)
+        for a, b in zip(path[:-1], path[1:]):
+            if (a, b) in index:
+                e, sign = index[(a, b)], 1
+            elif (b, a) in index:
+                e, sign = index[(b, a)], -1
+            else:
+                raise ValueError(f"Path step {(a, b)} is not an edge of the grid")
+            row = slice(C.indptr[e], C.indptr[e + 1])
+            winding[C.indices[row]] += sign * C.data[row]
+        return winding
+
+    def build_d1(self, as_sparse = False):
+        """Making boundary matrix d1: vertices to edges"""
+        V = self.vertex_array()
+        E = self.edge_array()
+        n = len(E)
+        rows = np.concatenate([np.searchsorted(V, E[:, 0]), np.searchsorted(V, E[:, 1])])
+        cols = np.concatenate([np.arange(n), np.arange(n)])
+        data = np.concatenate([-np.ones(n, dtype = int), np.ones(n, dtype = int)])
+        d1 = sparse.csr_matrix((data, (rows, cols)), shape = (len(V), n))
+
+        return d1 if as_sparse else d1.toarray()
+
+    def build_d2(self, as_sparse = False):
+        """Making boundary matrix d2: edges to triangles"""
+        E = self.edge_array()
+        T = self.triangle_array()
+        N = self.rows * self.cols
+
+        # Every edge is stored from its lower to its higher node ID, so a triangle side (a, b)
+        # is used forward when a < b and backward otherwise
+        a = T.ravel().astype(np.int64)
+        b = T[:, [1, 2, 0]].ravel().astype(np.int64)
+        keys = np.minimum(a, b) * N + np.maximum(a, b)
+        edge_keys = E[:, 0].astype(np.int64) * N + E[:, 1]
+        order = np.argsort(edge_keys)
+        pos = np.searchsorted(edge_keys, keys, sorter = order).clip(max = len(E) - 1)
+        found = edge_keys[order[pos]] == keys
+        if not found.all():
+            # should not happen; a defensive check
+            bad = np.argmin(found)
+            raise ValueError(f"Triangle edge {(a[bad], b[bad])} or {(b[bad], a[bad])} not found in edges")
+
+        data = np.where(a < b, 1, -1)
+        tri = np.repeat(np.arange(len(T)), 3)
+        d2 = sparse.csr_matrix((data, (order[pos], tri)), shape = (len(E), len(T)))
+
+        return d2 if as_sparse else d2.toarray()
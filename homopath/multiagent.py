@@ -0,0 +1,338 @@
+import time
+
+import numpy as np
+from scipy import sparse
+from scipy.sparse.csgraph import dijkstra
+
+from .cellcomplex import STEPS
+from .fields import HomologyCover
+from .flowlp import solve_master
+from .grid import GridBuilder
+
+
+class MultiAgentPlanner:
+    """
+    Edge-disjoint paths for several agents, each in the homology class of its own reference path.
+
+    Column generation over paths instead of one flow copy per agent: the master LP picks a convex
+    combination of known paths per agent subject to every edge carrying at most one agent (in either
+    direction). Pricing is a homology-constrained shortest path per agent, a Dijkstra sweep over the
+    HomologyCover with edge costs raised by the capacity duals. That is exact for paths that pass
+    every edge once; a path that retraces an edge is charged its dual on every pass, so pricing can
+    overlook such paths and the reported bound can then be slightly optimistic. Once no agent
+    prices out, an integer master over the generated paths picks one path per agent.
+
+    The cover has (2 max_winding + 1)^holes copies of the grid, so the planner suits maps with a few
+    holes (about six on a 100x100 grid under the default max_nodes); it is built on the first solve,
+    which raises ValueError when it would be larger
+    """
+
+    def __init__(self, rows, cols, holes = [], occupancy = None, dilation = 1, max_winding = 1,
+                 backend = "gurobi", max_nodes = 20_000_000):
+        self.grid = GridBuilder(rows, cols, holes, occupancy, dilation)
+        self.rows = self.grid.rows
+        self.cols = self.grid.cols
+        self.holes = self.grid.holes
+        self.complex = self.grid.complex()
+        self.max_winding = max_winding
+        self.max_nodes = max_nodes
+        self._cover = None
+        self.backend = backend
+        # slot[v, k] is the index of the edge leaving v along STEPS[k], or -1
+        E = self.complex.edges
+        self._slot = np.full((self.rows * self.cols, len(STEPS)), -1, dtype = np.int32)
+        self._slot[E[:, 0], self.complex.edge_steps] = np.arange(len(E), dtype = np.int32)
+
+    @property
+    def cover(self):
+        """HomologyCover used for pricing, built on first use"""
+        if self._cover is None:
+            self._cover = HomologyCover(self.grid, self.max_winding, max_nodes = self.max_nodes)
+        return self._cover
+
+    def path_edges(self, path):
+        """Edge indices (into edge_array) of the steps of a vertex ID path"""
+        p = np.asarray(path)
+        lo, hi = np.minimum(p[:-1], p[1:]), np.maximum(p[:-1], p[1:])
+        (li, lj), (hi_i, hj) = self.complex.coords(lo), self.complex.coords(hi)
+        di, dj = hi_i - li, hj - lj
+        k = np.select([(di == di_k) & (dj == dj_k) for (di_k, dj_k) in STEPS], range(len(STEPS)), -1)
+        e = np.where(k >= 0, self._slot[lo, k], -1)
+        if (e < 0).any():
+            raise ValueError("Path contains a step that is not an edge of the grid")
+        return e
+
+    def _price(self, agents, weights, limits = None):
+        """
+        Cheapest path per agent in its class under the given edge weights. With limits, the search
+        for agent a stops at cost limits[a] and paths that would cost more are not reported.
+
+        Output: list of (cost, path) per agent, (inf, None) when the class is unreachable
+        """
+        cover = self.cover
+        G = cover.graph(weights)
+        zero = np.zeros(cover.n_holes, dtype = int)
+        if limits is None:
+            sources = sorted({s for (s, _, _) in agents})
+            dist, pred = dijkstra(G, directed = True, indices = [cover._node(s, zero) for s in sources],
+                                  return_predecessors = True)
+            searches = [(dist[r], pred[r]) for r in (sources.index(s) for (s, _, _) in agents)]
+        else:
+            searches = [dijkstra(G, directed = True, indices = cover._node(s, zero), return_predecessors = True,
+                                 limit = limit) for (s, _, _), limit in zip(agents, limits)]
+
+        priced = []
+        for (s, t, winding), (dist, pred) in zip(agents, searches):
+            d = dist[cover._node(t, winding)]
+            if not np.isfinite(d):
+                priced.append((np.inf, None))
+                continue
+            path = cover.path(pred.reshape(cover.n_classes, cover.n), s, t, winding)
+            priced.append((d, path))
+        return priced
+
+    def _column(self, a, path, costs):
+        """
+        Master column (agent, cost, occupied edges) of a path. A path may retrace edges, e.g. when it
+        loops around a hole and comes back the same way; that costs every traversal but still
+        occupies each edge once, since disjointness only concerns different agents
+        """
+        edges = self.path_edges(path)
+        return a, costs[edges].sum(), np.unique(edges)
+
+    def _route_greedy(self, agents, costs, taken, order):
+        """
+        Route the agents in the given order one at a time, each on the cheapest path in its class
+        over the edges not yet taken, marking its edges as taken.
+
+        Output: {agent: (cost, path)} for the agents that could be routed
+        """
+        routed = {}
+        for a in order:
+            d, path = self._price([agents[a]], np.where(taken, np.inf, costs))[0]
+            if path is not None:
+                routed[a] = (d, path)
+                taken[self.path_edges(path)] = True
+        return routed
+
+    def _open_master(self, n_agents, penalty):
+        if self.backend == "gurobi":
+            return _GurobiMaster(len(self.complex.edges), n_agents, penalty)
+        return _RebuiltMaster(len(self.complex.edges), n_agents, penalty, self.backend)
+
+    def solve(self, ref_paths, max_iter = 100, gap = 1e-2, smoothing = 0.5, tol = 1e-6):
+        """
+        Edge-disjoint paths, one per reference path, each between the same endpoints and in the same
+        homology class as its reference. Column generation stops when no agent prices out, or when the
+        master LP is within a relative gap of the Lagrangian lower bound (the LP value plus every
+        agent's most negative reduced cost). smoothing is the weight of the best-bound duals in the
+        duals used for pricing (0 prices at the master duals).
+
+        Output: dict with the integer objective over the routed agents, the last master LP value, the
+                best lower bound, one vertex path per agent (None for an agent that could not be
+                routed), the number of columns and per-iteration timings; None if some agent's class
+                is unreachable even on its own
+        """
+        start = time.perf_counter()
+        cover = self.cover
+        agents = []
+        for ref in ref_paths:
+            winding = cover.winding_of(ref)
+            if np.abs(winding).max(initial = 0) > cover.max_winding:
+                raise ValueError(f"Reference winding {winding.tolist()} exceeds max_winding = {cover.max_winding}")
+            agents.append((ref[0], ref[-1], winding))
+        costs = self.complex.costs.astype(float)
+
+        # Initial columns: every agent's own shortest path in its class, and a greedy disjoint
+        # routing so that the master starts with (mostly) real paths instead of artificials
+        columns, paths = [], []
+        for a, (d, path) in enumerate(self._price(agents, costs)):
+            if path is None:
+                print(f"❌ Agent {a} has no path in its homology class")
+                return None
+            columns.append(self._column(a, path, costs))
+            paths.append(path)
+        shortest = sum(c for (_, c, _) in columns)
+        seen = {(a, tuple(p)) for (a, _, _), p in zip(columns, paths)}
+        for order in (range(len(agents)), reversed(range(len(agents)))):
+            greedy = self._route_greedy(agents, costs, np.zeros(len(costs), dtype = bool), order)
+            for a, (d, path) in greedy.items():
+                if (a, tuple(path)) not in seen:
+                    seen.add((a, tuple(path)))
+                    columns.append(self._column(a, path, costs))
+                    paths.append(path)
+        # Leaving one agent out costs as much as routing every agent along its own shortest path,
+        # far more than any sensible detour, while keeping the duals on the scale of path costs
+        penalty = shortest + 1
+        master = self._open_master(len(agents), penalty)
+        for column in columns:
+            master.add(*column)
+
+        iterations = []
+        lower = -np.inf
+        center = None
+        while len(iterations) < max_iter:
+            t0 = time.perf_counter()
+            x, lp_obj, pi, mu = master.solve()
+            t1 = time.perf_counter()
+
+            # Price at duals smoothed towards the ones that gave the best bound, which damps the
+            # oscillation of the capacity duals. If that finds nothing, price again at the master's
+            # own duals before concluding that the LP is optimal
+            alpha = smoothing if center is not None else 0.0
+            added = 0
+            while True:
+                duals = alpha * center + (1 - alpha) * pi if alpha > 0 else pi
+                # Capacity duals are <= 0, so the priced edge weights stay positive. Only paths cheaper
+                # than the agent's convexity dual can price out, so each search stops there; an agent
+                # that reaches nothing contributes that limit to the bound
+                priced = self._price(agents, costs - duals, limits = mu)
+                bound = duals.sum() + sum(min(d, limit, penalty) for (d, _), limit in zip(priced, mu))
+                if bound > lower:
+                    lower, center = bound, duals
+                for a, (_, path) in enumerate(priced):
+                    if path is None:
+                        continue
+                    column = self._column(a, path, costs)
+                    if column[1] - pi[column[2]].sum() - mu[a] < -tol:
+                        columns.append(column)
+                        paths.append(path)
+                        master.add(*column)
+                        added += 1
+                if added or alpha == 0:
+                    break
+                alpha = 0.0
+            t2 = time.perf_counter()
+
+            iterations.append({"lp_objective": lp_obj, "lower_bound": lower, "columns_added": added,
+                               "master": t1 - t0, "pricing": t2 - t1})
+            print(f"Iteration {len(iterations)}: LP {lp_obj:.4f}, bound {lower:.4f}, {added} columns added "
+                  f"(master {t1 - t0:.3f}s, pricing {t2 - t1:.3f}s)")
+            if added == 0 or lp_obj - lower <= gap * abs(lp_obj):
+                break
+
+        t0 = time.perf_counter()
+        x, _, _, _ = master.solve(integer = True)
+
+        chosen = [None] * len(agents)
+        for k in np.flatnonzero(x > 0.5):
+            chosen[columns[k][0]] = paths[k]
+        obj = sum(columns[k][1] for k in np.flatnonzero(x > 0.5))
+
+        # The integer master only sees the generated paths and can leave an agent on its artificial.
+        # Route those agents one at a time on the edges still free
+        taken = np.zeros(len(costs), dtype = bool)
+        for p in chosen:
+            if p is not None:
+                taken[self.path_edges(p)] = True
+        missing = [a for a, p in enumerate(chosen) if p is None]
+        for a, (d, path) in self._route_greedy(agents, costs, taken, missing).items():
+            chosen[a] = path
+            obj += d
+        t_int = time.perf_counter() - t0
+
+        routed = sum(p is not None for p in chosen)
+        if routed < len(agents):
+            print(f"❌ Only {routed} of {len(agents)} agents could be routed on disjoint edges")
+        else:
+            print(f"✅ Routed {len(agents)} agents on disjoint edges, total cost {obj:.4f} (LP {lp_obj:.4f})")
+
+        return {"objective": obj, "lp_objective": lp_obj, "lower_bound": lower, "paths": chosen, "columns": len(columns),
+                "iterations": iterations,
+                "times": {"integer": t_int, "total": time.perf_counter() - start}}
+
+
+class _GurobiMaster:
+    """
+    Master LP kept alive between iterations: new paths come in as columns and the previous basis
+    warm-starts the next solve. Each agent has a convexity row with an artificial at cost penalty.
+    A capacity row is only created once a second agent uses an edge; until then the convexity row
+    already keeps the load of that edge at most 1
+    """
+
+    def __init__(self, n_edges, n_agents, penalty):
+        import gurobipy as gp
+        from gurobipy import GRB
+
+        self.gp, self.GRB = gp, GRB
+        self.n_edges = n_edges
+        self.m = gp.Model("multiagent_master")
+        self.convexity = [self.m.addLConstr(gp.LinExpr(), GRB.EQUAL, 1.0, name = f"agent_{a}") for a in range(n_agents)]
+        self.artificial = [self.m.addVar(obj = penalty, column = gp.Column([1.0], [c]), name = f"artificial_{a}")
+                           for a, c in enumerate(self.convexity)]
+        self.vars = []
+        self.users = {}
+        self.owner = {}
+        self.rows = {}
+
+    def add(self, agent, cost, edges):
+        gp, GRB = self.gp, self.GRB
+        for e in edges.tolist():
+            if e not in self.rows and self.owner.setdefault(e, agent) != agent:
+                self.rows[e] = self.m.addLConstr(gp.quicksum(self.vars[k] for k in self.users[e]),
+                                                 GRB.LESS_EQUAL, 1.0, name = f"cap_{e}")
+        constrs = [self.convexity[agent]] + [self.rows[e] for e in edges.tolist() if e in self.rows]
+        var = self.m.addVar(obj = cost, column = gp.Column([1.0] * len(constrs), constrs), name = f"path_{len(self.vars)}")
+        for e in edges.tolist():
+            self.users.setdefault(e, []).append(len(self.vars))
+        self.vars.append(var)
+
+    def solve(self, integer = False):
+        """(x over the path columns, objective, edge duals, agent duals), duals None when integer"""
+        GRB = self.GRB
+        if integer:
+            for v in self.vars + self.artificial:
+                v.VType = GRB.BINARY
+        self.m.optimize()
+        if self.m.status != GRB.OPTIMAL:
+            return None
+        x = np.array([v.X for v in self.vars])
+        if integer:
+            return x, self.m.objVal, None, None
+        pi = np.zeros(self.n_edges)
+        for e, c in self.rows.items():
+            pi[e] = c.Pi
+        return x, self.m.objVal, pi, np.array([c.Pi for c in self.convexity])
+
+
+class _RebuiltMaster:
+    """
+    The same master for backends without warm starts, rebuilt and solved from scratch with
+    flowlp.solve_master on every call. Capacity rows are kept only for edges used by two agents
+    """
+
+    def __init__(self, n_edges, n_agents, penalty, backend):
+        self.n_edges = n_edges
+        self.n_agents = n_agents
+        self.penalty = penalty
+        self.backend = backend
+        self.columns = []
+
+    def add(self, agent, cost, edges):
+        self.columns.append((agent, cost, edges))
+
+    def solve(self, integer = False):
+        """(x over the path columns, objective, edge duals, agent duals), duals None when integer"""
+        n_agents, n = self.n_agents, len(self.columns)
+        agent = np.array([a for (a, _, _) in self.columns] + list(range(n_agents)))
+        cost = np.array([c for (_, c, _) in self.columns] + [self.penalty] * n_agents)
+
+        edges = np.concatenate([e for (_, _, e) in self.columns])
+        col = np.repeat(np.arange(n), [len(e) for (_, _, e) in self.columns])
+        pairs = np.unique(edges.astype(np.int64) * n_agents + agent[col])
+        shared = np.flatnonzero(np.bincount(pairs // n_agents, minlength = self.n_edges) > 1)
+        keep = np.isin(edges, shared)
+        A_ub = sparse.csr_matrix((np.ones(keep.sum()), (np.searchsorted(shared, edges[keep]), col[keep])),
+                                 shape = (len(shared), n + n_agents))
+        A_eq = sparse.csr_matrix((np.ones(n + n_agents), (agent, np.arange(n + n_agents))), shape = (n_agents, n + n_agents))
+
+        result = solve_master(cost, A_ub, np.ones(len(shared)), A_eq, np.ones(n_agents), integer = integer,
+                              backend = self.backend, name = "multiagent_master")
+        if result is None:
+            return None
+        x, obj, pi_shared, mu = result
+        if integer:
+            return x[:n], obj, None, None
+        pi = np.zeros(self.n_edges)
+        pi[shared] = pi_shared
+        return x[:n], obj, pi, mu
@@ -0,0 +1,254 @@
+import time
+
+import numpy as np
+from scipy import sparse
+
+from .grid import GridBuilder, dilate
+from .flowlp import flow_incidence, solve_lp
+
+
+def winding_angles(a, b, centres):
+    """
+    Signed angle swept around each centre by the straight segments a -> b.
+
+    a, b: (m, 2) arrays of (x, y) points; centres: (h, 2)
+    Output: (m, h) array
+    """
+    da = a[:, None, :] - centres[None, :, :]
+    db = b[:, None, :] - centres[None, :, :]
+    cross = da[..., 0] * db[..., 1] - da[..., 1] * db[..., 0]
+    dot = (da * db).sum(axis = 2)
+    return np.arctan2(cross, dot)
+
+
+def ray_crossings(a, b, centres):
+    """
+    Signed crossings of the straight segments a -> b with the upward ray x = c_x, y > c_y from each
+    centre: +1 left to right, -1 right to left, with x = c_x counted as the right side so a path
+    through a point on the ray is counted once. Like the cut cocycles this is an integer winding
+    signature, but the ray sits at fixed fine coordinates, so it means the same on every level.
+
+    a, b: (m, 2) arrays of (x, y) points; centres: (h, 2)
+    Output: sparse (m, h) int8 matrix with nonzeros only for segments crossing a ray
+    """
+    rows, cols, vals = [], [], []
+    for k, (cx, cy) in enumerate(np.asarray(centres, dtype = float)):
+        left_a, left_b = a[:, 0] < cx, b[:, 0] < cx
+        idx = np.flatnonzero(left_a != left_b)
+        if idx.size == 0:
+            continue
+        pa, pb = a[idx], b[idx]
+        y = pa[:, 1] + (cx - pa[:, 0]) * (pb[:, 1] - pa[:, 1]) / (pb[:, 0] - pa[:, 0])
+        above = y > cy
+        idx = idx[above]
+        rows.append(idx)
+        cols.append(np.full(idx.size, k))
+        vals.append(np.where(left_a[idx], 1, -1).astype(np.int8))
+    if not rows:
+        return sparse.csr_matrix((len(a), len(centres)), dtype = np.int8)
+    return sparse.csr_matrix((np.concatenate(vals), (np.concatenate(rows), np.concatenate(cols))),
+                             shape = (len(a), len(centres)), dtype = np.int8)
+
+
+class MultiResolutionPlanner:
+    """
+    Hierarchical homology-constrained planner. A coarsened complex that keeps the same holes is
+    solved first, then the full-resolution problem is solved only inside a corridor around the
+    coarse solution.
+
+    Homology is enforced through the signed crossings of the path with an upward ray from one fixed
+    point per hole, measured in fine grid coordinates (ray_crossings). That signature is linear in the
+    edge flows and sparse, one row per hole touching only the edges above its point, like the cut
+    cocycles; unlike those it means the same thing on every level, so the reference class carries
+    over from the fine grid to the coarse one and back.
+
+    Coarsening keeps a factor as long as every hole point lies in a blocked coarse cell; holes may
+    merge on the coarse level, in which case classes that pass between them are left to the
+    fallback to the flat solve
+    """
+
+    def __init__(self, rows, cols, holes = [], occupancy = None, dilation = 1, factor = 4, radius = None,
+                 backend = "gurobi"):
+        self.grid = GridBuilder(rows, cols, holes, occupancy, dilation)
+        self.rows = self.grid.rows
+        self.cols = self.grid.cols
+        self.holes = self.grid.holes
+        self.centres = np.array(self.holes, dtype = float).reshape(-1, 2)
+        self.backend = backend
+        self.factor, self.coarse = self._coarsen(factor)
+        self.radius = self.factor if radius is None else radius
+
+    def _coarsen(self, factor):
+        """
+        Keep every factor-th vertex. A coarse vertex is blocked when any blocked fine cell lies within
+        factor - 1 cells of it, which puts every fine hole centre strictly inside a coarse hole, and
+        no coarse edge runs through a centre. Halve the factor until every centre lies in a coarse
+        hole (not the outer boundary); several centres may share one
+        """
+        requested = factor
+        while factor > 1:
+            blocked = dilate(self.grid.blocked, factor - 1)[::factor, ::factor]
+            coarse = GridBuilder(None, None, occupancy = blocked, dilation = 0)
+            I, J = (self.centres // factor).astype(int).T
+            labels = coarse.hole_labels[J, I]
+            if (labels > 0).all():
+                merged = len(labels) - len(set(labels.tolist()))
+                if merged:
+                    print(f"Coarse level (factor {factor}) merges {merged} of {len(labels)} holes")
+                return factor, coarse
+            factor //= 2
+        if requested > 1:
+            print(f"No coarse level keeps every hole inside for factor {requested}; solving flat (factor 1)")
+        return 1, None
+
+    def _xy(self, ids, cols):
+        j, i = np.divmod(np.asarray(ids), cols)
+        return np.stack([i, j], axis = -1).astype(float)
+
+    def reference_crossings(self, ref_path):
+        """Signed ray crossings of the reference path for every hole (see ray_crossings)"""
+        xy = self._xy(ref_path, self.cols)
+        return np.asarray(ray_crossings(xy[:-1], xy[1:], self.centres).sum(axis = 0)).ravel()
+
+    def _hop(self, a, b):
+        """Ray crossings of the straight hop between two (1, 2) points"""
+        return ray_crossings(a, b, self.centres).toarray()[0]
+
+    def _solve_level(self, grid, s, t, theta, scale = 1, origin = (0, 0)):
+        """
+        Path LP on one level: unit s-t flow over E_full with the ray-crossing rows equal to theta.
+        This is the Model.solve formulation rather than solveflow: flow conservation and the winding
+        rows are both on x, without solveflow's separate flow f and its f <= x, f >= 1e-3 x coupling,
+        which doubles the LP. Grid vertex (i, j) sits at origin + scale * (i, j) in fine coordinates.
+
+        Output: (E, edges_val, objective) with E in grid IDs, or None if infeasible
+        """
+        V = grid.vertex_array()
+        E = grid.edge_array()
+        cost = grid.edge_costs() * scale
+        xy = self._xy(V, grid.cols) * scale + np.asarray(origin, dtype = float)
+
+        nodes = np.searchsorted(V, E)
+        A_flow = flow_incidence(len(V), nodes)
+        b_flow = np.zeros(len(V))
+        b_flow[np.searchsorted(V, s)] += 1
+        b_flow[np.searchsorted(V, t)] -= 1
+
+        W = ray_crossings(xy[nodes[:, 0]], xy[nodes[:, 1]], self.centres)
+        A_hom = sparse.vstack([W, -W]).T
+
+        A_eq = sparse.vstack([A_flow, A_hom]).tocsr()
+        b_eq = np.concatenate([b_flow, theta])
+        result = solve_lp(np.concatenate([cost, cost]), A_eq, b_eq, backend = self.backend, name = "multires_flow")
+        if result is None:
+            return None
+        x, obj = result
+        m = len(E)
+        return E, x[:m] - x[m:], obj
+
+    def _snap(self, v):
+        """Nearest free coarse vertex to fine vertex v"""
+        Vc = self.coarse.vertex_array()
+        xy = self._xy(Vc, self.coarse.cols) * self.factor
+        d = ((xy - self._xy(v, self.cols)) ** 2).sum(axis = 1)
+        return Vc[np.argmin(d)]
+
+    def _corridor(self, segments):
+        """Fine cells within self.radius of the given (a, b) segments in fine coordinates"""
+        mask = np.zeros((self.rows, self.cols), dtype = bool)
+        for a, b in segments:
+            n = int(np.abs(b - a).max()) + 1
+            pts = np.rint(a + (b - a) * np.linspace(0.0, 1.0, n)[:, None]).astype(int)
+            mask[pts[:, 1], pts[:, 0]] = True
+        return dilate(mask, self.radius) & ~self.grid.blocked
+
+    def solve_flat(self, ref_path, tol = 1e-3):
+        """Single-level solve on the full grid with the same winding constraints"""
+        s, t = ref_path[0], ref_path[-1]
+        start = time.perf_counter()
+        result = self._solve_level(self.grid, s, t, self.reference_crossings(ref_path))
+        if result is None:
+            return None
+        E, edges_val, obj = result
+        used = np.abs(edges_val) > tol
+        return {"objective": obj, "edges": E[used], "edges_val": edges_val[used],
+                "times": {"total": time.perf_counter() - start}}
+
+    def solve(self, ref_path, tol = 1e-3):
+        """
+        Coarse solve, then refinement inside the corridor around the coarse support.
+
+        When either level is infeasible, e.g. because a hop to a snapped endpoint clips an obstacle or
+        the corridor is too narrow, the flat solve is returned instead, marked with "fallback": True.
+
+        Output: dict with the fine objective, the used fine edges (IDs of the full grid) and their
+                net flow, the coarse objective and per-stage timings; None if the flat solve is infeasible
+        """
+        if self.coarse is None:
+            return self.solve_flat(ref_path, tol)
+        start = time.perf_counter()
+        k = self.factor
+        s, t = ref_path[0], ref_path[-1]
+        theta = self.reference_crossings(ref_path)
+
+        # Coarse level: close the reference path with straight hops to the snapped endpoints
+        sc, tc = self._snap(s), self._snap(t)
+        s_xy, t_xy = self._xy([s], self.cols), self._xy([t], self.cols)
+        sc_xy, tc_xy = self._xy([sc], self.coarse.cols) * k, self._xy([tc], self.coarse.cols) * k
+        theta_c = theta + self._hop(sc_xy, s_xy) + self._hop(t_xy, tc_xy)
+        coarse = self._solve_level(self.coarse, sc, tc, theta_c, scale = k)
+        t_coarse = time.perf_counter()
+        if coarse is None:
+            return self._fallback(ref_path, tol)
+        Ec, xc, obj_c = coarse
+
+        support = Ec[np.abs(xc) > tol]
+        a = self._xy(support[:, 0], self.coarse.cols) * k
+        b = self._xy(support[:, 1], self.coarse.cols) * k
+        segments = list(zip(a, b)) + [(s_xy[0], sc_xy[0]), (tc_xy[0], t_xy[0])]
+        corridor = self._corridor(segments)
+
+        # Fine level on the corridor's bounding box. The crop origin keeps i + j parity so the
+        # diagonals match the full grid
+        jj, ii = np.nonzero(corridor)
+        i0, j0 = ii.min(), jj.min()
+        if (i0 + j0) % 2:
+            if i0 > 0:
+                i0 -= 1
+            else:
+                j0 -= 1
+        i1, j1 = ii.max() + 1, jj.max() + 1
+        sub = GridBuilder(None, None, occupancy = ~corridor[j0:j1, i0:i1], dilation = 0)
+        s_sub = (s // self.cols - j0) * sub.cols + (s % self.cols - i0)
+        t_sub = (t // self.cols - j0) * sub.cols + (t % self.cols - i0)
+        fine = self._solve_level(sub, s_sub, t_sub, theta, origin = (i0, j0))
+        t_fine = time.perf_counter()
+        if fine is None:
+            return self._fallback(ref_path, tol)
+        E, edges_val, obj = fine
+
+        used = np.abs(edges_val) > tol
+        sj, si = np.divmod(E[used], sub.cols)
+        return {"objective": obj, "edges": (sj + j0) * self.cols + (si + i0), "edges_val": edges_val[used],
+                "coarse_objective": obj_c, "factor": k, "corridor_vertices": int(corridor.sum()),
+                "times": {"coarse": t_coarse - start, "fine": t_fine - t_coarse, "total": t_fine - start}}
+
+    def _fallback(self, ref_path, tol):
+        print("Hierarchical solve infeasible, falling back to the flat solve")
+        result = self.solve_flat(ref_path, tol)
+        if result is not None:
+            result["fallback"] = True
+        return result
+
+    def compare(self, ref_path, tol = 1e-3):
+        """Run the hierarchical and flat solves and report the solution-quality gap and speedup"""
+        hier = self.solve(ref_path, tol)
+        flat = self.solve_flat(ref_path, tol)
+        if hier is None or flat is None:
+            return None
+        gap = (hier["objective"] - flat["objective"]) / flat["objective"]
+        speedup = flat["times"]["total"] / hier["times"]["total"]
+        print(f"Hierarchical: {hier['objective']:.4f} in {hier['times']['total']:.3f}s, "
+              f"flat: {flat['objective']:.4f} in {flat['times']['total']:.3f}s "
+              f"(gap {100 * gap:.2f}%, speedup {speedup:.1f}x)")
+        return {"hierarchical": hier, "flat": flat, "gap": gap, "speedup": speedup}
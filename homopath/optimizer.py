@@ -0,0 +1,662 @@
+import queue
+import threading
+import time
+
+import numpy as np
+
+from ._lazy import LazyModule
+from .grid import GridBuilder
+
+# gurobipy is imported by the first solve, not by importing this module
+gp = LazyModule("gurobipy")
+GRB = LazyModule("gurobipy", "GRB")
+
+class Model:
+    """
+    rows, cols, holes, occupancy and dilation describe the map as for GridBuilder. Pass grid instead
+    to share one GridBuilder, and its complex, with other objects built on the same map
+    """
+
+    def __init__(self, rows = None, cols = None, holes = [], occupancy = None, dilation = 1, grid = None):
+        self.grid = grid if grid is not None else GridBuilder(rows, cols, holes, occupancy, dilation)
+        self.rows = self.grid.rows
+        self.cols = self.grid.cols
+        self.holes = self.grid.holes
+        self.complex = self.grid.complex()
+        self._H = {}
+        self.adaptive_stats = {"lp": 0, "ip": 0}
+
+    def warm(self):
+        """Precompute the harmonic basis, cut cocycles and edge costs so later solves skip them"""
+        self._create_H()
+        self.grid.cut_cocycles()
+        self._cost()
+        return self
+
+    @property
+    def vertices(self):
+        return self.complex.vertex_list
+
+    @property
+    def vertdict(self):
+        return self.complex.vert_dict
+
+    @property
+    def edges(self):
+        return self.complex.edge_list
+
+    def _cost(self):
+        """Create a cost vector for the edges"""
+        return self.complex.cost_dict
+    
+    def _path_vector(self, path):
+        """Signed edge chain of a path; an edge walked there and back cancels, so the boundary is t - s"""
+        path_vec = np.zeros(len(self.edges), dtype = int)
+        e_idx = self.complex.edge_index
+
+        for i in range(len(path) - 1):
+            edge = (path[i], path[i + 1])
+            if edge in e_idx:
+                path_vec[e_idx[edge]] += 1
+            else:
+                reverse_edge = (path[i + 1], path[i])
+                if reverse_edge in e_idx:
+                    path_vec[e_idx[reverse_edge]] -= 1
+        
+        return path_vec
+    
+    def _check_path(self, ref_path):
+        """
+        Validate a reference path before any model is built: at least two vertices and every step
+        an edge of the grid, else ValueError. Returns its winding vector
+        """
+        if len(ref_path) < 2:
+            raise ValueError("Reference path needs at least two vertices")
+        return self.grid.winding_of(ref_path)
+
+    def _create_H(self, tol = 1e-6):
+        if tol in self._H:
+            return self._H[tol]
+        from scipy.linalg import svd
+        grid = self.grid
+        d1 = grid.build_d1()
+        d2 = grid.build_d2()
+        L = d1.T @ d1 + d2 @ d2.T
+
+        # SVD to extract null space
+        U, S, Vh = svd(L)
+        null_mask = (S < tol)
+        H = Vh[null_mask].T
+        self._H[tol] = H
+
+        return H
+    
+    def _homology_rhs(self, ref_path, homology = "harmonic"):
+        """Right-hand sides of the homology rows for ref_path: H.T @ x_ref, or C.T @ x_ref for the cocycles"""
+        x_ref = self._path_vector(ref_path)
+        if homology == "harmonic":
+            return self._create_H().T @ x_ref
+        if homology == "cocycle":
+            return self.grid.cut_cocycles().T @ x_ref
+        raise ValueError(f"Unknown homology constraint mode {homology!r}, expected 'harmonic' or 'cocycle'")
+
+    def _add_homology_constraints(self, m, x, ref_path, homology = "harmonic"):
+        """
+        Pin the homology class of the flow x to that of ref_path.
+
+        homology: "harmonic" uses the columns of H, which are dense in the edges. "cocycle" uses the
+                  integral cut cocycles of GridBuilder.cut_cocycles: one row per hole touching only
+                  the edges that cross its cut ray, with an integer right-hand side
+        Output: list of the homology constraints
+        """
+        E = self.edges
+        h_ref = self._homology_rhs(ref_path, homology)
+        rows = []
+
+        if homology == "harmonic":
+            H = self._create_H()
+            for k in range(H.shape[1]):
+                harmonic_proj = gp.quicksum(
+                    H[i, k] * (x[E[i]] - x[(E[i][1], E[i][0])])
+                    for i in range(len(E))
+                )
+                rows.append(m.addConstr(harmonic_proj == h_ref[k], name=f"harm_proj_{k}"))
+
+        else:
+            C = self.grid.cut_cocycles().tocsc()
+            for k in range(C.shape[1]):
+                col = slice(C.indptr[k], C.indptr[k + 1])
+                crossings = gp.quicksum(
+                    int(c) * (x[E[i]] - x[(E[i][1], E[i][0])])
+                    for i, c in zip(C.indices[col], C.data[col])
+                )
+                rows.append(m.addConstr(crossings == int(h_ref[k]), name=f"cocycle_{k}"))
+        return rows
+
+    def _add_flow_rows(self, m, flow, s, t):
+        """
+        Unit s-t flow conservation on flow (variables keyed by arc), built from per-vertex arc buckets
+        in linear time. Output: {vertex: flow constraint}
+        """
+        V = self.vertices
+        arcs_in = {v: [] for v in V}
+        arcs_out = {v: [] for v in V}
+        for (a, b), var in flow.items():
+            arcs_out[a].append(var)
+            arcs_in[b].append(var)
+        rows = {}
+        for v in V:
+            rhs = 1 if v == s else -1 if v == t else 0
+            rows[v] = m.addConstr(gp.quicksum(arcs_out[v]) - gp.quicksum(arcs_in[v]) == rhs, name = f"flow_{v}")
+        return rows
+
+    def _report_solution(self, m, x, tol):
+        """Consolidate an optimal x over E_full into (opt_path, objective, edges_val) over E"""
+        E = self.edges
+
+        # Consolidate results into forward-bias
+        edges_val = []
+        for e in E:
+            forward_val = x[e].X
+            reverse_val = x[(e[1], e[0])].X
+            net_val = forward_val - reverse_val
+            if abs(net_val) < tol:
+                net_val = 0.0
+            edges_val.append(net_val)
+
+        # Binary indicator of which edges are used
+        opt_path = [abs(v) > tol for v in edges_val]
+
+        # Print debug info
+        print("✅ Found optimal path:")
+        for i, e in enumerate(E):
+            if abs(edges_val[i]) > tol:
+                direction = "forward" if edges_val[i] > 0 else "backward"
+                print(f"  Edge {e} used {direction}, value={edges_val[i]:.3f}")
+        print(f"Total cost: {m.objVal}")
+
+        return opt_path, m.objVal, edges_val
+
+    def _report_infeasible(self, m, diagnose = False):
+        """Report a failed solve. The IIS is only computed when diagnose is set, as it can take longer than the solve"""
+        if not diagnose:
+            print(f"❌ No solution found (status {m.status})")
+            return None
+        print("❌ No solution found. Computing IIS...")
+        m.computeIIS()
+        for c in m.getConstrs():
+            if c.IISConstr:
+                print(f"  - {c.ConstrName}")
+        for v in m.getVars():
+            if v.IISLB: print(f"  - {v.VarName} has conflicting lower bound")
+            if v.IISUB: print(f"  - {v.VarName} has conflicting upper bound")
+        return None
+
+    # Gurobi model names of the formulations built by _build_formulation
+    FORMULATIONS = {"solve": "homology_constrained_shortest_path", "solveMTZ": "homology_constrained_shortest_path",
+                    "solveflow": "flow_homology"}
+
+    def _build_formulation(self, method, ref_path, homology = "harmonic", env = None):
+        """
+        Build the model behind solve, solveMTZ or solveflow for ref_path.
+
+        solve:     LP, flow conservation and homology rows on x, routed from the first to the last vertex
+        solveMTZ:  binary x with MTZ subtour elimination, routed between the ends of ref_path
+        solveflow: LP with a separate flow f, f <= x and f >= 1e-3 x; harmonic rows on x, cocycle rows on f
+        Output: (gurobi model, x, rows) with rows = {"flow": {v: constr}, "homology": [constr],
+                "u": MTZ variables or None, "s": source, "t": target}
+        """
+        V = self.vertices
+        E_full = self._arcs()
+        if method == "solve":
+            s = V[0]; t = V[-1]
+        else:
+            s = ref_path[0]; t = ref_path[-1]
+        cost = self._cost()
+
+        m = gp.Model(self.FORMULATIONS[method], env = env)
+
+        if method == "solveMTZ":
+            x = m.addVars(E_full, vtype = GRB.BINARY, name = "x") # IP
+        else:
+            x = m.addVars(E_full, vtype = GRB.CONTINUOUS, lb = 0.0, ub = 1.0, name = "x") # LP
+
+        m.setObjective(gp.quicksum(cost[e] * x[e] for e in E_full), GRB.MINIMIZE)
+
+        flow = x
+        if method == "solveflow":
+            flow = m.addVars(E_full, vtype = GRB.CONTINUOUS, lb = 0.0, name = "f") # flow
+            # Capacity constraints on flow
+            for e in E_full:
+                m.addConstr(flow[e] <= x[e], name=f"cap_{e}")
+                m.addConstr(flow[e] >= (10**(-3)) * x[e], name=f"pos_{e}")
+
+        rows = {"flow": self._add_flow_rows(m, flow, s, t), "s": s, "t": t}
+        # Homology constraints (forward minus reverse). In solveflow x need not conserve flow, so a cut
+        # row on x could be met by x on a lone crossing edge; the cocycle rows count crossings of f
+        pinned = flow if homology == "cocycle" else x
+        rows["homology"] = self._add_homology_constraints(m, pinned, ref_path, homology)
+        rows["u"] = self._add_mtz(m, x, s) if method == "solveMTZ" else None
+        return m, x, rows
+
+    def _solve_formulation(self, method, ref_path, tol, homology, diagnose, env):
+        self._check_path(ref_path)
+        m, x, _ = self._build_formulation(method, ref_path, homology, env)
+        m.optimize()
+
+        if m.status == GRB.OPTIMAL:
+            return self._report_solution(m, x, tol)
+
+        else:
+            return self._report_infeasible(m, diagnose)
+
+    def solve(self, ref_path, tol = 1e-3, homology = "harmonic", diagnose = False, env = None):
+        return self._solve_formulation("solve", ref_path, tol, homology, diagnose, env)
+
+    def solveMTZ(self, ref_path, tol = 1e-3, homology = "harmonic", diagnose = False, env = None):
+        return self._solve_formulation("solveMTZ", ref_path, tol, homology, diagnose, env)
+
+    def solveflow(self, ref_path, tol = 1e-3, homology = "harmonic", diagnose = False, env = None):
+        return self._solve_formulation("solveflow", ref_path, tol, homology, diagnose, env)
+
+    def _support_path(self, xval, s, t, tol):
+        """
+        Linear-time check of an LP solution over E_full: every arc is within tol of 0 or 1 and the
+        arcs at 1 form one simple s-t path with no detached cycles. Returns that path as a list of
+        vertex IDs, or None
+        """
+        succ = {}
+        for (a, b), val in xval.items():
+            if tol < val < 1 - tol:
+                return None
+            if val >= 1 - tol:
+                if a in succ:
+                    return None
+                succ[a] = b
+
+        path = [s]
+        seen = {s}
+        while path[-1] != t:
+            nxt = succ.get(path[-1])
+            if nxt is None or nxt in seen:
+                return None
+            path.append(nxt)
+            seen.add(nxt)
+        # Any arc left over belongs to a cycle away from the path
+        return path if len(path) - 1 == len(succ) else None
+
+    def _round_path(self, xval, s, t, ref_path, tol):
+        """
+        Incumbent for the IP: walk from s along the heaviest LP arcs without revisiting a vertex and
+        keep the walk if it reaches t in the class of ref_path; otherwise fall back to ref_path
+        itself when it is simple. None if neither works
+        """
+        succ = {}
+        for (a, b), val in xval.items():
+            if val > tol:
+                succ.setdefault(a, []).append((val, b))
+
+        path = [s]
+        seen = {s}
+        while path[-1] != t:
+            options = [(val, b) for (val, b) in succ.get(path[-1], []) if b not in seen]
+            if not options:
+                break
+            path.append(max(options)[1])
+            seen.add(path[-1])
+
+        ref_winding = self.grid.winding_of(ref_path)
+        if path[-1] == t and np.array_equal(self.grid.winding_of(path), ref_winding):
+            return path
+        if len(set(ref_path)) == len(ref_path):
+            return list(ref_path)
+        return None
+
+    def _arcs(self):
+        """E_full: every edge in both directions"""
+        E = list(self.edges)
+        return E + [(b, a) for (a, b) in E]
+
+    def _build_path_model(self, name, ref_path, homology, vtype, env = None):
+        """
+        Unit ref_path[0] -> ref_path[-1] flow over E_full in the homology class of ref_path, with the
+        flow rows built from per-vertex arc buckets in linear time.
+
+        Output: (gurobi model, x variables keyed by arc)
+        """
+        E_full = self._arcs()
+        s = ref_path[0]; t = ref_path[-1]
+        cost = self._cost()
+
+        m = gp.Model(name, env = env)
+        x = m.addVars(E_full, vtype = vtype, lb = 0.0, ub = 1.0, name = "x")
+        m.setObjective(gp.quicksum(cost[e] * x[e] for e in E_full), GRB.MINIMIZE)
+        self._add_flow_rows(m, x, s, t)
+
+        # Homology constraints (forward minus reverse)
+        self._add_homology_constraints(m, x, ref_path, homology)
+        return m, x
+
+    def _add_mtz(self, m, x, s):
+        """MTZ constraints to eliminate subtours; returns the ordering variables u"""
+        V = self.vertices
+        N = len(V)
+        u = m.addVars(V, vtype = GRB.CONTINUOUS, lb = 0.0, ub = N - 1, name = "u")
+        m.addConstr(u[s] == 0, name = "u_start")
+        for (a, b) in self._arcs():
+            m.addConstr(u[a] - u[b] + N * x[(a, b)] <= N - 1, name = f"mtz_{a}_{b}")
+        return u
+
+    def _set_start(self, x, u, path):
+        """MIP start from a simple path given as vertex IDs"""
+        on_path = set(zip(path[:-1], path[1:]))
+        order = {v: k for k, v in enumerate(path)}
+        for e in x.keys():
+            x[e].Start = 1.0 if e in on_path else 0.0
+        for v in u.keys():
+            u[v].Start = order.get(v, 0)
+
+    def _path_cost(self, path):
+        cost = self._cost()
+        return sum(cost[(a, b)] for a, b in zip(path[:-1], path[1:]))
+
+    def solve_adaptive(self, ref_path, tol = 1e-3, homology = "harmonic", diagnose = False, env = None):
+        """
+        LP first, IP only when needed. The LP relaxation of the path model is solved and its support
+        checked: when it is integral and forms a single s-t path it is optimal for the IP as well and
+        is returned straight away. Otherwise the same model is turned into the MTZ integer program of
+        solveMTZ, warm-started from the LP basis, with arcs whose reduced cost exceeds the rounding
+        gap fixed to 0 and the rounded LP path (or ref_path) as the starting incumbent.
+        self.adaptive_stats counts how often each branch was taken
+        """
+        self._check_path(ref_path)
+        E_full = self._arcs()
+        V = self.vertices
+        s = ref_path[0]; t = ref_path[-1]
+
+        m, x = self._build_path_model("homology_constrained_shortest_path", ref_path, homology, GRB.CONTINUOUS, env)
+
+        m.optimize()
+
+        if m.status != GRB.OPTIMAL:
+            return self._report_infeasible(m, diagnose)
+
+        xval = {e: x[e].X for e in E_full}
+        if self._support_path(xval, s, t, tol) is not None:
+            print("LP solution is an integral s-t path, no IP needed")
+            self.adaptive_stats["lp"] += 1
+            return self._report_solution(m, x, tol)
+
+        print("LP solution is fractional or has detached cycles, escalating to the IP")
+        self.adaptive_stats["ip"] += 1
+        lp_obj = m.objVal
+        vbasis = {e: x[e].VBasis for e in E_full}
+        cbasis = [c.CBasis for c in m.getConstrs()]
+        start = self._round_path(xval, s, t, ref_path, tol)
+
+        # Reduced-cost fixing: an arc whose reduced cost alone exceeds the gap between the
+        # incumbent and the LP bound cannot be in an optimal solution
+        if start is not None:
+            gap = self._path_cost(start) - lp_obj
+            fixed = 0
+            for e in E_full:
+                if x[e].RC > gap + tol:
+                    x[e].UB = 0.0
+                    fixed += 1
+            print(f"Fixed {fixed} of {len(E_full)} arcs by reduced cost (gap {gap:.3f})")
+
+        u = self._add_mtz(m, x, s)
+        for e in E_full:
+            x[e].VType = GRB.BINARY
+        m.update()
+
+        # Warm start the root relaxation from the LP basis: the new rows start with basic slacks
+        # and the new u variables at their lower bound
+        for e in E_full:
+            x[e].VBasis = vbasis[e]
+        for v in V:
+            u[v].VBasis = -1
+        for c, b in zip(m.getConstrs(), cbasis):
+            c.CBasis = b
+        for c in m.getConstrs()[len(cbasis):]:
+            c.CBasis = 0
+
+        if start is not None:
+            self._set_start(x, u, start)
+
+        m.optimize()
+
+        if m.status == GRB.OPTIMAL:
+            return self._report_solution(m, x, tol)
+
+        else:
+            return self._report_infeasible(m, diagnose)
+
+    # Seconds per cover node (cover search) and per arc (MIP build, by homology mode) that iter_anytime
+    # assumes before it has timed these stages on a model; after that it uses the last measured rates
+    ANYTIME_RATES = {"cover": 1.5e-6, "build_cocycle": 3e-5, "build_harmonic": 5e-5}
+
+    def _anytime_estimate(self, stage, size):
+        rates = getattr(self, "_anytime_rates", None)
+        if rates is None:
+            rates = self._anytime_rates = dict(self.ANYTIME_RATES)
+        return rates[stage] * size
+
+    def _anytime_record(self, stage, size, seconds):
+        self._anytime_estimate(stage, 0)
+        self._anytime_rates[stage] = seconds / max(size, 1)
+
+    def _cover_size(self, winding, max_nodes):
+        """(max_winding, nodes) of the HomologyCover for a reference winding, None if it exceeds max_nodes"""
+        if len(winding) == 0:
+            return None
+        max_winding = max(1, int(np.abs(winding).max()))
+        nodes = (2 * max_winding + 1) ** len(winding) * len(self.vertices)
+        return None if nodes > max_nodes else (max_winding, nodes)
+
+    def _cover_path(self, ref_path, winding, max_winding):
+        """
+        Shortest path in the class of ref_path by Dijkstra over the HomologyCover bounded by
+        max_winding, used as a quick anytime incumbent. None if the path found is not simple
+        """
+        from .fields import HomologyCover
+
+        cover = getattr(self, "_cover", None)
+        if cover is None or cover.max_winding != max_winding:
+            cover = self._cover = HomologyCover(self.grid, max_winding)
+        _, pred = cover.shortest_paths(ref_path[0], return_predecessors = True)
+        path = cover.path(pred, ref_path[0], ref_path[-1], winding)
+        if path is None or len(set(path)) != len(path):
+            return None
+        return path
+
+    def iter_anytime(self, ref_path, time_limit = 1.0, tol = 1e-3, homology = "harmonic", diagnose = False,
+                     env = None, max_nodes = 2_000_000):
+        """
+        Anytime solve under a time budget in seconds. Yields a dict for every improved path in the class
+        of ref_path, as soon as it is found:
+          path       vertex IDs
+          objective  path cost
+          bound      best lower bound so far (None before the MIP has one)
+          gap        (objective - bound) / objective, None without a bound
+          elapsed    seconds since the call
+          source     "reference", "search" (HomologyCover shortest path) or "mip"
+          status     "incumbent", then "optimal" or "time_limit" on the final item
+        The reference path comes first when it is simple, then the cover search result, then the
+        incumbents of the MTZ program, which runs for the rest of the budget started from the best
+        path so far. Stopping the iteration early terminates the solver.
+
+        The budget covers every stage. The cover search (at most max_nodes cover nodes) and the MIP
+        are skipped when their predicted time, from the rates last measured on this model, exceeds
+        what is left, and the MIP time limit is what remains after building it. With
+        homology = "harmonic" and the harmonic basis not yet computed (see warm()), the MIP uses the
+        cocycle rows instead, which define the same classes, rather than spending the budget on an SVD.
+        A solver error is raised once the solver thread has stopped. The IIS of a failed solve is
+        only computed when diagnose is set
+        """
+        begin = time.perf_counter()
+        winding = self._check_path(ref_path)
+        s = ref_path[0]; t = ref_path[-1]
+        best = None
+
+        def left():
+            return time_limit - (time.perf_counter() - begin)
+
+        def item(path, objective, source, bound = None, status = "incumbent"):
+            gap = None if bound is None else max(0.0, objective - bound) / max(abs(objective), 1e-10)
+            return {"path": path, "objective": objective, "bound": bound, "gap": gap,
+                    "elapsed": time.perf_counter() - begin, "source": source, "status": status}
+
+        if len(set(ref_path)) == len(ref_path):
+            best = item(list(ref_path), self._path_cost(ref_path), "reference")
+            yield best
+
+        cover = self._cover_size(winding, max_nodes)
+        if cover is not None and self._anytime_estimate("cover", cover[1]) < left():
+            started = time.perf_counter()
+            path = self._cover_path(ref_path, winding, cover[0])
+            self._anytime_record("cover", cover[1], time.perf_counter() - started)
+            if path is not None and (best is None or self._path_cost(path) < best["objective"] - tol):
+                best = item(path, self._path_cost(path), "search")
+                yield best
+
+        arcs = self._arcs()
+        if homology == "harmonic" and 1e-6 not in self._H:
+            homology = "cocycle"
+        m = None
+        if self._anytime_estimate(f"build_{homology}", len(arcs)) < left():
+            started = time.perf_counter()
+            m, x = self._build_path_model("anytime_homology_constrained_path", ref_path, homology, GRB.BINARY, env)
+            u = self._add_mtz(m, x, s)
+            self._anytime_record(f"build_{homology}", len(arcs), time.perf_counter() - started)
+            if left() <= 0:
+                m = None
+
+        if m is None:
+            print("Time budget used up before the MIP")
+            if best is not None:
+                best = item(best["path"], best["objective"], best["source"], status = "time_limit")
+                yield best
+            return
+
+        m.Params.TimeLimit = left()
+        if best is not None:
+            self._set_start(x, u, best["path"])
+
+        xvars = [x[e] for e in arcs]
+        found = queue.Queue()
+        done = object()
+
+        def callback(model, where):
+            if where == GRB.Callback.MIPSOL:
+                xval = dict(zip(arcs, model.cbGetSolution(xvars)))
+                path = self._support_path(xval, s, t, tol)
+                if path is not None:
+                    found.put((path, model.cbGet(GRB.Callback.MIPSOL_OBJ), model.cbGet(GRB.Callback.MIPSOL_OBJBND)))
+
+        def run():
+            try:
+                m.optimize(callback)
+            except Exception as exc:
+                found.put(exc)
+            finally:
+                found.put(done)
+
+        error = None
+        worker = threading.Thread(target = run, daemon = True)
+        worker.start()
+        try:
+            while True:
+                entry = found.get()
+                if entry is done:
+                    break
+                if isinstance(entry, Exception):
+                    error = entry
+                    continue
+                path, objective, bound = entry
+                if best is None or objective < best["objective"] - tol:
+                    best = item(path, objective, "mip", bound)
+                    yield best
+        finally:
+            m.terminate()
+            worker.join()
+        if error is not None:
+            raise error
+
+        if m.SolCount == 0:
+            if best is None:
+                self._report_infeasible(m, diagnose and m.status == GRB.INFEASIBLE)
+                return
+            bound = None
+        else:
+            bound = m.ObjBound
+        status = "optimal" if m.status == GRB.OPTIMAL else "time_limit"
+        best = item(best["path"], best["objective"], best["source"], bound, status)
+        yield best
+
+    def solve_anytime(self, ref_path, time_limit = 1.0, callback = None, tol = 1e-3, homology = "harmonic",
+                      diagnose = False, env = None):
+        """
+        Run iter_anytime to the end of the budget, passing each improved path to callback(item).
+        Output: the final item (best path, objective, gap and status) or None if no path was found
+        """
+        best = None
+        for best in self.iter_anytime(ref_path, time_limit, tol, homology, diagnose, env):
+            if callback is not None:
+                callback(best)
+        return best
+
+
+class PathProblem:
+    """
+    One solve/solveMTZ/solveflow formulation of a Model kept built between queries. The first query
+    builds it; later ones only move the flow right-hand sides to their endpoints, reset the homology
+    right-hand sides to their class (and the MTZ start vertex), so they skip the model build and the
+    LPs restart from the previous basis. A gurobipy Env is not thread-safe: keep one PathProblem per
+    thread and env
+    """
+
+    METHODS = tuple(Model.FORMULATIONS)
+
+    def __init__(self, model, method = "solveflow", homology = "harmonic", env = None):
+        if method not in self.METHODS:
+            raise ValueError(f"Unknown method {method!r}, expected one of {self.METHODS}")
+        self.model = model
+        self.method = method
+        self.homology = homology
+        self.env = env
+        self.m = None
+        self.solves = 0
+
+    def _retarget(self, ref_path):
+        model, rows = self.model, self.rows
+        if self.method != "solve":
+            s = ref_path[0]; t = ref_path[-1]
+            for v in (rows["s"], rows["t"]):
+                rows["flow"][v].RHS = 0
+            rows["flow"][s].RHS = 1
+            rows["flow"][t].RHS = -1
+            if rows["u"] is not None and s != rows["s"]:
+                start = self.m.getConstrByName("u_start")
+                self.m.chgCoeff(start, rows["u"][rows["s"]], 0.0)
+                self.m.chgCoeff(start, rows["u"][s], 1.0)
+            rows["s"], rows["t"] = s, t
+        for c, h in zip(rows["homology"], model._homology_rhs(ref_path, self.homology)):
+            c.RHS = h
+
+    def solve(self, ref_path, tol = 1e-3, diagnose = False):
+        """Same result as model.<method>(ref_path, tol, homology), reusing the built model"""
+        self.model._check_path(ref_path)
+        if self.m is None:
+            self.m, self.x, self.rows = self.model._build_formulation(self.method, ref_path, self.homology, self.env)
+        else:
+            self._retarget(ref_path)
+        self.solves += 1
+        m = self.m
+        m.optimize()
+
+        if m.status == GRB.OPTIMAL:
+            return self.model._report_solution(m, self.x, tol)
+
+        else:
+            return self.model._report_infeasible(m, diagnose)
@@ -1,48 +1,50 @@
 import numpy as np
-import gurobipy as gp
-from gurobipy import GRB
-from scipy.linalg import svd
 
-from grid import GridBuilder
+from ._lazy import LazyModule
+from .grid import GridBuilder
+
+# gurobipy is imported by the first solve, not by importing this module
+gp = LazyModule("gurobipy")
+GRB = LazyModule("gurobipy", "GRB")
 
 class Model1:
+    """OHCP solver. grid: an existing GridBuilder to reuse instead of building one from the map arguments"""
+
+    def __init__(self, rows = None, cols = None, holes = [], occupancy = None, dilation = 1, grid = None):
+        self.grid = grid if grid is not None else GridBuilder(rows, cols, holes, occupancy, dilation)
+        self.rows = self.grid.rows
+        self.cols = self.grid.cols
+        self.holes = self.grid.holes
+        self.complex = self.grid.complex()
+
+    @property
+    def vertices(self):
+        return self.complex.vertex_list
 
-    def __init__(self, rows, cols, holes = []):
-        self.rows = rows
-        self.cols = cols
-        self.holes = holes
-        self.grid = GridBuilder(rows, cols, holes)
-        self.vertices, self.vertdict = self.grid.get_vertices()
-        self.edges = self.grid.get_edges()
+    @property
+    def vertdict(self):
+        return self.complex.vert_dict
+
+    @property
+    def edges(self):
+        return self.complex.edge_list
 
     def _cost(self):
         """Create a cost vector for the edges"""
-        vdict = self.vertdict
-        Rvdict = {v: k for k, v in vdict.items()}
-        cost = {}
-        for (a, b) in self.edges:
-            (x1, y1) = Rvdict[a]
-            (x2, y2) = Rvdict[b]
-            if x1 == x2 or y1 == y2:
-                cost[(a,b)] = 1
-                cost[(b,a)] = 1
-            else:
-                cost[(a, b)] = np.sqrt(2)
-                cost[(b, a)] = np.sqrt(2)
-        return cost
+        return self.complex.cost_dict
     
     def _path_vector(self, path):
         path_vec = np.zeros(len(self.edges), dtype = int)
-        e_idx = {e : i for i, e in enumerate(self.edges)}
+        e_idx = self.complex.edge_index
 
         for i in range(len(path) - 1):
             edge = (path[i], path[i + 1])
             if edge in e_idx:
-                path_vec[e_idx[edge]] = 1
+                path_vec[e_idx[edge]] += 1
             else:
                 reverse_edge = (path[i + 1], path[i])
                 if reverse_edge in e_idx:
-                    path_vec[e_idx[reverse_edge]] = -1
+                    path_vec[e_idx[reverse_edge]] -= 1
         
         return path_vec
     
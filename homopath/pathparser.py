@@ -1,5 +1,3 @@
-from optimizer1 import Model1
-
 class PathParser:
     # Function that parses path into pure path and cycles (much like flow decomposition)
     @staticmethod
@@ -0,0 +1,103 @@
+import numpy as np
+from .grid import GridBuilder
+
+# matplotlib is imported inside the drawing methods, so building a Plotter does not load it
+
+class Plotter:
+    """Draws a grid and paths on it; pass grid to draw the GridBuilder a Model already uses"""
+
+    def __init__(self, rows = None, cols = None, holes = [], occupancy = None, dilation = 1, grid = None):
+        self.grid = grid if grid is not None else GridBuilder(rows, cols, holes, occupancy, dilation)
+        self.rows = self.grid.rows
+        self.cols = self.grid.cols
+        self.holes = self.grid.holes
+
+    def plotfig(self, path = None, opt_edge_vals = None, color = "orange",ax = None):
+        import matplotlib.pyplot as plt
+        from matplotlib.collections import LineCollection
+
+        if ax is None:
+            fig, ax = plt.subplots(figsize=(8, 6))
+        
+        ys, xs = np.divmod(self.grid.vertex_array(), self.cols)
+        ax.plot(xs, ys, 'ko', ms = 1.5)
+        # for x, y, v in zip(xs, ys, self.grid.vertex_array()): plt.text(x + 0.1, y + 0.1, str(v), fontsize = 8, color = 'blue')
+
+        ax.plot(0, 0, 'k*', ms = 9)
+        ax.plot(self.cols - 1, self.rows - 1, 'k*', ms = 9)
+
+        E = self.grid.edge_array()
+        ej, ei = np.divmod(E, self.cols)
+        segments = np.stack([ei, ej], axis = 2)
+        ax.add_collection(LineCollection(segments, colors = 'k', linewidths = 0.5))
+
+        # shading the blocked cells, whether they come from an occupancy map or dilated hole centres
+        ax.imshow(self.grid.blocked, origin = 'lower', cmap = 'Greys', vmin = 0, vmax = 1, alpha = 0.3,
+                  extent = (-0.5, self.cols - 0.5, -0.5, self.rows - 0.5), interpolation = 'nearest')
+
+        ax.set_xlim(-1, self.cols)
+        ax.set_ylim(-1, self.rows)
+        ax.set_aspect('equal', adjustable='box')
+
+        # Plot the path with arrows
+        if path:
+            if len(path) != len(E):
+                self._plot_path_with_arrows_some_edges(path, color, label='Reference Path', ax = ax)
+            else:
+                self._plot_path_with_arrows_all_edges(path, opt_edge_vals, color, label='Reference Path', ax = ax)
+
+ 
+        ax.set_title(f"{self.rows} x {self.cols} Grid with Holes and Path")
+        ax.grid(False)
+        
+        return ax
+
+    def _plot_path_with_arrows_some_edges(self, path, color = "orange", label = None, ax = None):
+        import matplotlib.pyplot as plt
+        from matplotlib.patches import FancyArrowPatch
+
+        if ax is None:
+            ax = plt.gca()
+        
+        coords = self.grid.complex().coords
+
+        for i in range(len(path) - 1):
+            x1, y1 = coords(path[i])
+            x2, y2 = coords(path[i + 1])
+            arrow = FancyArrowPatch(
+                (x1, y1),
+                (x2, y2),
+                arrowstyle='->',
+                color=color,
+                linewidth=2,
+                mutation_scale= 10,  # scales the arrowhead
+                zorder=10
+            )
+            ax.add_patch(arrow)
+
+        if label:
+            ax.plot([], [], color=color, label=label)
+    
+    def _plot_path_with_arrows_all_edges(self, path, opt_edge_vals, color = "orange", label = None, ax = None):
+        import matplotlib.pyplot as plt
+        from matplotlib.patches import FancyArrowPatch
+
+        if ax is None:
+            ax = plt.gca()
+        
+        coords = self.grid.complex().coords
+        E = self.grid.edge_array()
+        edges_val = opt_edge_vals
+
+        # Modify _plot_path_with_arrows_all_edges:
+        for i in range(len(edges_val)):
+            if abs(edges_val[i]) > 1e-6:
+                if edges_val[i] > 0:
+                    (x1, y1), (x2, y2) = coords(E[i][0]), coords(E[i][1])
+                else:  # backward
+                    (x1, y1), (x2, y2) = coords(E[i][1]), coords(E[i][0])
+                arrow = FancyArrowPatch((x1, y1), (x2, y2), arrowstyle='->', color=color, linewidth=2, mutation_scale=10, zorder=10)
+                ax.add_patch(arrow)
+
+        if label:
+            ax.plot([], [], color=color, label=label)
\ No newline at end of file
@@ -0,0 +1,237 @@
+import json
+import queue
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import numpy as np
+
+from ._lazy import LazyModule
+from .cache import SolutionCache
+from .optimizer import Model, PathProblem
+
+gp = LazyModule("gurobipy")
+
+
+class MapCache:
+    """
+    Keeps one warm Model per map in memory. Concurrent requests for a map that is still
+    being built wait on the same build instead of starting their own
+    """
+
+    def __init__(self):
+        self._models = {}
+        self._lock = threading.Lock()
+        self.builds = 0
+
+    @staticmethod
+    def key(rows, cols, holes):
+        return (int(rows), int(cols), tuple(sorted((int(i), int(j)) for (i, j) in holes)))
+
+    def get(self, rows, cols, holes = []):
+        """Return the warm Model for this map, building it at most once"""
+        key = self.key(rows, cols, holes)
+        with self._lock:
+            future = self._models.get(key)
+            owner = future is None
+            if owner:
+                future = Future()
+                self._models[key] = future
+        if owner:
+            try:
+                model = Model(key[0], key[1], list(key[2])).warm()
+            except BaseException as exc:
+                with self._lock:
+                    del self._models[key]
+                future.set_exception(exc)
+                raise
+            with self._lock:
+                self.builds += 1
+            future.set_result(model)
+        return future.result()
+
+    def __len__(self):
+        return len(self._models)
+
+
+class LatencyStats:
+    """Rolling window of request latencies (seconds)"""
+
+    def __init__(self, window = 10000):
+        self._samples = deque(maxlen = window)
+        self._lock = threading.Lock()
+
+    def record(self, seconds):
+        with self._lock:
+            self._samples.append(seconds)
+
+    def percentiles(self, qs = (50, 90, 99)):
+        with self._lock:
+            samples = np.array(self._samples)
+        if samples.size == 0:
+            return {f"p{q}": None for q in qs}
+        return {f"p{q}": float(np.percentile(samples, q)) for q in qs}
+
+
+class PlanningService:
+    """
+    Long-running planner. Requests go through a bounded queue served by a fixed pool of
+    worker threads; when the queue is full new requests are rejected instead of piling up.
+    Gurobi environments are not thread-safe, so every worker solves in its own gurobipy Env, where it
+    keeps one built PathProblem per (map, method, homology) that later queries only retarget
+    """
+
+    METHODS = ("solve", "solveflow", "solveMTZ", "solve_adaptive")
+    HOMOLOGY = ("harmonic", "cocycle")
+
+    def __init__(self, workers = 2, max_queue = 16, cache_dir = None):
+        self.maps = MapCache()
+        self.solutions = SolutionCache(directory = cache_dir)
+        self.latency = LatencyStats()
+        self.jobs = queue.Queue(maxsize = max_queue)
+        self.completed = 0
+        self.rejected = 0
+        self.failed = 0
+        self._lock = threading.Lock()
+        self._workers = [threading.Thread(target = self._work, daemon = True) for _ in range(workers)]
+        for w in self._workers:
+            w.start()
+
+    def submit(self, query):
+        """Queue a path query. Returns a Future, or raises queue.Full when saturated"""
+        if not isinstance(query, dict):
+            raise ValueError("query must be a JSON object")
+        future = Future()
+        try:
+            self.jobs.put_nowait((query, future, time.perf_counter()))
+        except queue.Full:
+            with self._lock:
+                self.rejected += 1
+            raise
+        return future
+
+    def _work(self):
+        env = None
+        problems = {}
+        while True:
+            query, future, t0 = self.jobs.get()
+            try:
+                if env is None:
+                    env = gp.Env()
+                result = self.plan(query, env, problems)
+            except Exception as exc:
+                with self._lock:
+                    self.failed += 1
+                future.set_exception(exc)
+            else:
+                elapsed = time.perf_counter() - t0
+                self.latency.record(elapsed)
+                with self._lock:
+                    self.completed += 1
+                result["latency"] = elapsed
+                future.set_result(result)
+            finally:
+                self.jobs.task_done()
+
+    def plan(self, query, env = None, problems = None):
+        """
+        Solve one query of the form {rows, cols, holes, path, method, homology}, in the gurobipy Env env
+        if given. problems holds the caller's PathProblems, keyed by (map, method, homology)
+        """
+        method = query.get("method", "solveflow")
+        if method not in self.METHODS:
+            raise ValueError(f"Unknown method {method!r}, expected one of {self.METHODS}")
+        homology = query.get("homology", "harmonic")
+        if homology not in self.HOMOLOGY:
+            raise ValueError(f"Unknown homology mode {homology!r}, expected one of {self.HOMOLOGY}")
+        holes = query.get("holes", [])
+        model = self.maps.get(query["rows"], query["cols"], holes)
+        solver = None
+        if problems is not None and method in PathProblem.METHODS:
+            key = (self.maps.key(query["rows"], query["cols"], holes), method, homology)
+            if key not in problems:
+                problems[key] = PathProblem(model, method, homology, env)
+            solver = problems[key].solve
+        result = self.solutions.solve(model, [int(v) for v in query["path"]], method, env = env, solver = solver,
+                                      homology = homology)
+        if result is None:
+            return {"status": "infeasible"}
+        _, obj_val, edges_val = result
+        used = [[int(a), int(b)] if val > 0 else [int(b), int(a)]
+                for (a, b), val in zip(model.edges, edges_val) if val != 0]
+        return {"status": "optimal", "objective": obj_val, "edges_val": edges_val, "path_edges": used}
+
+    def stats(self):
+        with self._lock:
+            counts = {"completed": self.completed, "rejected": self.rejected, "failed": self.failed}
+        counts.update(queued = self.jobs.qsize(), maps = len(self.maps), map_builds = self.maps.builds)
+        counts["latency"] = self.latency.percentiles()
+        counts["solution_cache"] = self.solutions.stats()
+        return counts
+
+
+class _Handler(BaseHTTPRequestHandler):
+
+    def _reply(self, status, body):
+        data = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        if status == 503:
+            self.send_header("Retry-After", "1")
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self):
+        if self.path == "/stats":
+            self._reply(200, self.server.service.stats())
+        else:
+            self._reply(404, {"error": "not found"})
+
+    def do_POST(self):
+        if self.path != "/plan":
+            self._reply(404, {"error": "not found"})
+            return
+        try:
+            query = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))))
+            future = self.server.service.submit(query)
+        except queue.Full:
+            self._reply(503, {"error": "queue full"})
+            return
+        except ValueError as exc:
+            self._reply(400, {"error": str(exc)})
+            return
+        try:
+            self._reply(200, future.result())
+        except (KeyError, ValueError) as exc:
+            self._reply(400, {"error": str(exc)})
+        except Exception as exc:
+            self._reply(500, {"error": str(exc)})
+
+    def log_message(self, format, *args):
+        pass
+
+
+def make_server(host = "127.0.0.1", port = 8765, workers = 2, max_queue = 16, cache_dir = None):
+    """Create an HTTP server with POST /plan and GET /stats. Call serve_forever() to run it"""
+    httpd = ThreadingHTTPServer((host, port), _Handler)
+    httpd.service = PlanningService(workers, max_queue, cache_dir)
+    return httpd
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description = "Homology-constrained path planning server")
+    parser.add_argument("--host", default = "127.0.0.1")
+    parser.add_argument("--port", type = int, default = 8765)
+    parser.add_argument("--workers", type = int, default = 2)
+    parser.add_argument("--max-queue", type = int, default = 16)
+    parser.add_argument("--cache-dir", default = None, help = "directory for the on-disk solution cache")
+    args = parser.parse_args()
+
+    httpd = make_server(args.host, args.port, args.workers, args.max_queue, args.cache_dir)
+    print(f"Serving on http://{args.host}:{args.port} (POST /plan, GET /stats)")
+    httpd.serve_forever()
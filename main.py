@@ -1,10 +1,5 @@
-from grid import GridBuilder
-from plotter import Plotter
-from optimizer import Model
-from optimizer1 import Model1
-from pathparser import PathParser
+from homopath import GridBuilder, Model, PathParser, Plotter
 
-import matplotlib.pyplot as plt
 import numpy as np
 
 import time
@@ -40,21 +35,28 @@ Tprime = grid.generate_triangles()
 D1 = grid.build_d1()
 D2 = grid.build_d2()
 
-plot = Plotter(rows, cols, holes)
+plot = Plotter(grid = grid)
 # plot.plotfig(path)
 
-# model = Model(rows, cols, holes)
+# model = Model(grid = grid)
 # start1 = time.time()
 # opt_path, opt_val, opt_edge_vals = model.solveMTZ(path)
 # end1 = time.time()
 # print(f"MTZ Model Solve Time: {end1 - start1} seconds")
 
-model = Model(rows, cols, holes)
+model = Model(grid = grid)
 start1 = time.time()
 opt_path, opt_val, opt_edge_vals = model.solveflow(path)
 end1 = time.time()
 print(f"Flow Model Solve Time: {end1 - start1} seconds")
 
+# Anytime solve with a per-replan deadline: a path in the reference class comes back immediately,
+# better ones follow with their optimality gap until the budget runs out
+# for it in model.iter_anytime(path, time_limit = 0.5):
+#     print(f"{it['elapsed']:.3f}s {it['source']}: cost {it['objective']:.3f}, gap {it['gap']}")
+
+import matplotlib.pyplot as plt # only needed once we plot
+
 fig, ax = plt.subplots(figsize=(8, 6))
 plot.plotfig(path, color="orange", ax = ax)            # creates Figure 1
 plot.plotfig(opt_path, opt_edge_vals, color="blue", ax = ax)          # creates Figure 2
@@ -66,7 +68,8 @@ plt.show()
 
 ## OHCP and Dual
 
-# model1 = Model1(rows, cols, holes)
+# from homopath import Model1
+# model1 = Model1(grid = grid)
 # start2 = time.time()
 # opt_path1, opt_val1, opt_edge_vals1 = model1.solve_OHCP(path)
 # end2 = time.time()
@@ -77,6 +80,13 @@ plt.show()
 # lambdaval, obj = model1.solve_dual_OHCP(path)
 # print(f"Dual Objective Value: {lambdaval}")
 
+## Cocycle vs harmonic homology constraints (far fewer nonzeros)
+
+# for mode in ("harmonic", "cocycle"):
+#     start3 = time.time()
+#     _, val, _ = model.solveflow(path, homology = mode)
+#     print(f"{mode}: cost {val}, solve time {time.time() - start3} seconds")
+
 ## Analyzing the optimized path
 
 # pure_path, cycles = PathParser.parse_path(opt_edge_vals, Eprime) ## edges are directional here
@@ -135,3 +145,16 @@ plt.show()
 
 ## Trying edge-disjoint paths
 
+# Column generation: each agent keeps the class of its reference path and no two agents share an edge
+
+# from homopath import MultiAgentPlanner
+# planner = MultiAgentPlanner(rows, cols, holes)
+# left_top = [j * cols for j in range(rows)] + list(range((rows - 1) * cols + 1, rows * cols))
+# result = planner.solve([path, left_top])
+# for k, it in enumerate(result["iterations"]):
+#     print(f"Iteration {k + 1}: master {it['master']:.3f}s, pricing {it['pricing']:.3f}s")
+
+# fig, ax = plt.subplots(figsize=(8, 6))
+# for agent_path, color in zip(result["paths"], ["blue", "green"]):
+#     plot.plotfig(agent_path, color = color, ax = ax)
+# plt.show()
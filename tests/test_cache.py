@@ -0,0 +1,20 @@
+from homopath import Model, SolutionCache
+
+ROWS, COLS = 9, 9
+HOLES = [(2, 3), (6, 5)]
+REF_PATH = list(range(COLS)) + [j * COLS + COLS - 1 for j in range(1, ROWS)]
+
+
+def test_key_includes_solver_options():
+    model = Model(ROWS, COLS, HOLES)
+    harmonic = SolutionCache.key(model, REF_PATH, "solveflow", homology = "harmonic")
+    cocycle = SolutionCache.key(model, REF_PATH, "solveflow", homology = "cocycle")
+    assert harmonic != cocycle
+    assert harmonic == SolutionCache.key(model, REF_PATH, "solveflow", homology = "harmonic")
+
+
+def test_key_uses_reference_endpoints_for_solve():
+    model = Model(ROWS, COLS, HOLES)
+    shorter = REF_PATH[:-1]
+    assert (model.grid.winding_of(shorter) == model.grid.winding_of(REF_PATH)).all()
+    assert SolutionCache.key(model, shorter, "solve") != SolutionCache.key(model, REF_PATH, "solve")
@@ -0,0 +1,63 @@
+import numpy as np
+import pytest
+
+from homopath import GridBuilder
+
+# The 19x19 example from main.py
+ROWS, COLS = 19, 19
+HOLES = [(4, 4), (14, 4), (14, 14), (9, 9), (4, 14)]
+
+
+@pytest.fixture(scope = "module")
+def complex19():
+    return GridBuilder(ROWS, COLS, HOLES).complex()
+
+
+def test_footprint_reduction(complex19):
+    fp = complex19.footprint()
+    print(f"compact {fp['compact']} B ({fp['compact_per_edge']:.1f} B/edge), "
+          f"legacy {fp['legacy']} B ({fp['legacy_per_edge']:.1f} B/edge), {fp['reduction']:.1f}x smaller")
+    assert fp["reduction"] > 10
+    assert fp["compact_per_edge"] < 32
+
+
+def test_arrays_are_compact(complex19):
+    c = complex19
+    assert c.vertices.dtype == np.int32 and c.edges.dtype == np.int32
+    assert c.triangles.dtype == np.int32 and c.costs.dtype == np.float32
+    assert not hasattr(c, "__dict__")
+
+
+def test_vertex_views_match_arrays(complex19):
+    c = complex19
+    assert c.vertex_list == c.vertices.tolist()
+    assert len(c.vert_dict) == len(c.vertices)
+    for (i, j), v in c.vert_dict.items():
+        assert v == c.vertex_id(i, j) == j * COLS + i
+        assert c.coords(v) == (i, j)
+        assert c.reverse_vdict[v] == (i, j)
+
+
+def test_edge_and_cost_views_match_arrays(complex19):
+    c = complex19
+    assert c.edge_list == [tuple(e) for e in c.edges.tolist()]
+    assert all(c.edge_index[e] == k for k, e in enumerate(c.edge_list))
+    assert len(c.cost_dict) == 2 * len(c.edges)
+    for (a, b), cost in zip(c.edge_list, c.costs.tolist()):
+        assert c.cost_dict[(a, b)] == c.cost_dict[(b, a)] == cost
+    assert c.triangle_list == [tuple(t) for t in c.triangles.tolist()]
+
+
+def test_footprint_leaves_views_unbuilt():
+    c = GridBuilder(ROWS, COLS, HOLES).complex()
+    c.footprint()
+    assert c._vert_dict is None and c._edge_list is None and c._cost_dict is None
+
+
+def test_classes_share_one_grid():
+    from homopath import Model, Model1, Plotter
+
+    grid = GridBuilder(ROWS, COLS, HOLES)
+    objects = [Model(grid = grid), Model1(grid = grid), Plotter(grid = grid)]
+    assert all(o.grid is grid for o in objects)
+    assert objects[0].complex is objects[1].complex is grid.complex()
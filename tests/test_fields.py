@@ -0,0 +1,51 @@
+import numpy as np
+import pytest
+
+from homopath import GridBuilder, HomologyCover
+
+# 9x9 example from main.py; OPTIMUM is the solveMTZ optimum in the class of REF_PATH (test_optimizer)
+ROWS, COLS = 9, 9
+HOLES = [(2, 3), (6, 5)]
+REF_PATH = list(range(COLS)) + [j * COLS + COLS - 1 for j in range(1, ROWS)]
+OPTIMUM = 10 + 3 * 2 ** 0.5
+
+
+@pytest.fixture(scope = "module")
+def cover():
+    return HomologyCover(GridBuilder(ROWS, COLS, HOLES), 1)
+
+
+def test_field_in_reference_class_matches_optimum(cover):
+    field = cover.field(0)
+    c = cover.class_index(cover.winding_of(REF_PATH))
+    assert field[c, ROWS - 1, COLS - 1] == pytest.approx(OPTIMUM, abs = 1e-4)
+    assert field[cover.class_index([0, 0]), 0, 0] == 0
+
+
+def test_field_memmap_round_trip(cover, tmp_path):
+    out = tmp_path / "field.npy"
+    field = cover.field(0, out = out)
+    loaded = np.load(out, mmap_mode = "r")
+    assert isinstance(loaded, np.memmap)
+    assert loaded.shape == (cover.n_classes, ROWS, COLS) and loaded.dtype == np.float32
+    np.testing.assert_array_equal(loaded, field)
+    np.testing.assert_array_equal(loaded, cover.field(0))
+
+
+def test_too_many_classes_raise_up_front():
+    holes = [(10 + 14 * a, 10 + 14 * b) for a in range(8) for b in range(6)]
+    grid = GridBuilder(120, 120, holes)
+    with pytest.raises(ValueError, match = "max_nodes"):
+        HomologyCover(grid, 1)
+
+
+def test_tracked_holes_restrict_the_classes(cover):
+    partial = HomologyCover(cover.grid, 1, holes = [1])
+    assert partial.n_classes == 3 and partial.windings.shape == (3, 1)
+    np.testing.assert_array_equal(partial.winding_of(REF_PATH), cover.winding_of(REF_PATH)[[1]])
+    # Tracking fewer holes only merges classes, so the best path to the goal cannot get dearer
+    full, part = cover.field(0), partial.field(0)
+    c, k = cover.class_index(cover.winding_of(REF_PATH)), partial.class_index(partial.winding_of(REF_PATH))
+    assert part[k, ROWS - 1, COLS - 1] <= full[c, ROWS - 1, COLS - 1] + 1e-6
+    with pytest.raises(ValueError, match = "range"):
+        HomologyCover(cover.grid, 1, holes = [2])
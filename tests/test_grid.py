@@ -1,16 +1,16 @@
-import numpy as np
+import pytest
 
-class GridBuilder:
-    """
-    This class instantiates grid objects. Each grid object has some rows, columns and may have holes in it
-    """
+from homopath import GridBuilder
+
+
+class BaselineGridBuilder:
+    """The list/dict GridBuilder that hole lists were built with before GridComplex, kept verbatim as a reference"""
 
     def __init__(self, rows, cols, holes = []):
-        """Initialize a grid object"""
         self.rows = rows
         self.cols = cols
         self.holes = holes
-    
+
     def get_vertices(self):
         """ Create a list of vertices with unique signatures (node IDs) for the grid. Accounts for holes
         
@@ -110,34 +110,26 @@ class GridBuilder:
                         triangles.append((u, w, v))
         
         return triangles
-    
-    def build_d1(self):
-        """Making boundary matrix d1: vertices to edges"""
-        m = len(self.get_vertices()[0])
-        n = len(self.get_edges())
-        d1 = np.zeros((m, n), dtype = int)
 
-        for i, (u, v) in enumerate(self.get_edges()):
-            d1[self.get_vertices()[0].index(u), i] = -1
-            d1[self.get_vertices()[0].index(v), i] = 1
 
-        return d1
-    
-    def build_d2(self):
-        """Making boundary matrix d2: edges to triangles"""
-        edges = self.get_edges()
-        triangles = self.generate_triangles()
-
-        d2 = np.zeros((len(edges), len(triangles)), dtype = int)
-
-        for j, (u, v, w) in enumerate(triangles):
-            for (a, b) in [(u, v), (v, w), (w, u)]:
-                if (a, b) in edges:
-                    d2[edges.index((a, b)), j] = 1
-                elif (b, a) in edges:
-                    d2[edges.index((b, a)), j] = -1
-                else:
-                # should not happen; a defensive check
-                    raise ValueError(f"Triangle edge {(a,b)} or {(b,a)} not found in edges")
-
-        return d2
\ No newline at end of file
+MAPS = [
+    (9, 9, [(2, 3), (6, 5)]),
+    (9, 9, [(4, 4)]),
+    (11, 11, [(5, 5)]),
+    (13, 13, [(3, 3), (9, 4), (6, 9)]),
+    (19, 19, [(4, 4), (14, 4), (14, 14), (9, 9), (4, 14)]),
+]
+
+
+@pytest.mark.parametrize("rows, cols, holes", MAPS)
+def test_hole_lists_match_baseline(rows, cols, holes):
+    baseline = BaselineGridBuilder(rows, cols, holes)
+    grid = GridBuilder(rows, cols, holes)
+    assert grid.get_vertices() == baseline.get_vertices()
+    assert grid.get_edges() == baseline.get_edges()
+    assert grid.generate_triangles() == baseline.generate_triangles()
+
+
+def test_hole_outside_grid_is_rejected():
+    with pytest.raises(ValueError, match = "outside"):
+        GridBuilder(9, 9, [(9, 4)])
@@ -0,0 +1,49 @@
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Backends a grid-only worker must not pay for
+HEAVY = ("gurobipy", "matplotlib", "scipy.linalg")
+
+# Eager imports in the old main.py took about 0.8 s; a grid-only start or a Model construction now
+# measures around 0.1 s, so this fails as soon as a backend creeps back into the import path
+BUDGET = 0.3
+
+
+def _run(code):
+    """Run code in a fresh interpreter; it prints a JSON object as its last line"""
+    script = "import json, sys, time\nstart = time.perf_counter()\n" + code
+    out = subprocess.run([sys.executable, "-c", script], cwd = ROOT, capture_output = True, text = True,
+                         check = True, env = dict(os.environ, PYTHONPATH = ROOT))
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+REPORT = ("print(json.dumps({'elapsed': time.perf_counter() - start, "
+          "'loaded': [m for m in %r if m in sys.modules]}))" % (HEAVY,))
+
+
+def test_grid_only_start_skips_backends():
+    result = _run("import homopath\n"
+                  "grid = homopath.GridBuilder(9, 9, [(2, 3), (6, 5)])\n"
+                  "grid.complex()\n" + REPORT)
+    assert result["loaded"] == []
+    assert result["elapsed"] < BUDGET
+
+
+@pytest.mark.parametrize("name", ["Model", "Model1", "Plotter", "SolutionCache"])
+def test_importing_a_name_skips_backends(name):
+    result = _run(f"from homopath import {name}\n" + REPORT)
+    assert result["loaded"] == []
+    assert result["elapsed"] < BUDGET
+
+
+def test_model_construction_skips_backends():
+    result = _run("from homopath import Model\n"
+                  "model = Model(9, 9, [(2, 3), (6, 5)])\n" + REPORT)
+    assert result["loaded"] == []
+    assert result["elapsed"] < BUDGET
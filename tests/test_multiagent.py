@@ -0,0 +1,38 @@
+import numpy as np
+import pytest
+
+from homopath import MultiAgentPlanner
+
+ROWS, COLS = 20, 20
+HOLES = [(6, 6), (13, 12)]
+
+
+def test_paths_are_disjoint_and_keep_their_class():
+    planner = MultiAgentPlanner(ROWS, COLS, HOLES, backend = "highs")
+    top_right = list(range(COLS)) + [j * COLS + COLS - 1 for j in range(1, ROWS)]
+    left_bottom = [j * COLS for j in range(ROWS)] + list(range((ROWS - 1) * COLS + 1, ROWS * COLS))
+    # From the top right corner down the middle column, then left along the bottom row
+    middle = list(range(COLS - 1, COLS // 2 - 1, -1)) + [j * COLS + COLS // 2 for j in range(1, ROWS)] + \
+             list(range((ROWS - 1) * COLS + COLS // 2 - 1, (ROWS - 1) * COLS - 1, -1))
+    refs = [top_right, left_bottom, middle]
+
+    result = planner.solve(refs)
+    assert result is not None
+    paths = result["paths"]
+    assert all(p is not None for p in paths)
+
+    used = [set(planner.path_edges(p).tolist()) for p in paths]
+    for a in range(len(used)):
+        for b in range(a + 1, len(used)):
+            assert not used[a] & used[b]
+    for ref, path in zip(refs, paths):
+        assert (path[0], path[-1]) == (ref[0], ref[-1])
+        np.testing.assert_array_equal(planner.grid.winding_of(path), planner.grid.winding_of(ref))
+    assert result["lower_bound"] <= result["objective"] + 1e-6
+
+
+def test_oversized_cover_is_refused_on_solve():
+    holes = [(10 + 12 * a, 10 + 20 * b) for a in range(7) for b in range(4)]
+    planner = MultiAgentPlanner(100, 100, holes, backend = "highs")
+    with pytest.raises(ValueError, match = "max_nodes"):
+        planner.solve([list(range(100))])
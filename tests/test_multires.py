@@ -0,0 +1,53 @@
+import numpy as np
+import pytest
+
+from homopath import HomologyCover, Model, MultiResolutionPlanner, ray_crossings
+
+
+def raster(size = 64, blobs = 8, seed = 0):
+    """Occupancy raster with small square obstacles away from the border and from each other"""
+    rng = np.random.default_rng(seed)
+    occ = np.zeros((size, size), dtype = bool)
+    placed = 0
+    while placed < blobs:
+        i, j = rng.integers(6, size - 9, size = 2)
+        if occ[j - 4:j + 7, i - 4:i + 7].any():
+            continue
+        occ[j:j + 3, i:i + 3] = True
+        placed += 1
+    return occ
+
+
+def test_ray_crossings_count_a_loop_once():
+    # A square loop around (0, 0), passing through a vertex on the ray
+    loop = np.array([(-1, -1), (1, -1), (1, 1), (0, 1), (-1, 1), (-1, -1)], dtype = float)
+    W = ray_crossings(loop[:-1], loop[1:], [(0.0, 0.0), (5.0, 5.0)])
+    assert W.sum(axis = 0).tolist() == [[-1, 0]]
+    assert W.nnz == 1
+
+
+def test_compare_on_raster():
+    occ = raster()
+    planner = MultiResolutionPlanner(None, None, occupancy = occ, dilation = 1, backend = "highs")
+    assert planner.factor > 1
+    n = occ.shape[1]
+    ref = list(range(n)) + [j * n + n - 1 for j in range(1, n)]
+    result = planner.compare(ref)
+    assert result is not None
+    assert result["hierarchical"].get("fallback") is None
+    assert -1e-9 <= result["gap"] < 0.05
+
+
+def test_flat_matches_cocycle_model():
+    pytest.importorskip("gurobipy")
+    holes = [(2, 3), (6, 5)]
+    model = Model(9, 9, holes)
+    planner = MultiResolutionPlanner(9, 9, holes, backend = "highs")
+    cover = HomologyCover(model.grid, 1)
+    _, pred = cover.shortest_paths(0, return_predecessors = True)
+    for w in cover.windings:
+        path = cover.path(pred, 0, 80, w)
+        flat, exact = planner.solve_flat(path), model.solve(path, homology = "cocycle")
+        assert (flat is None) == (exact is None)
+        if exact is not None:
+            assert flat["objective"] == pytest.approx(exact[1], abs = 1e-6)
@@ -0,0 +1,90 @@
+import numpy as np
+import pytest
+
+from homopath import Model
+
+pytest.importorskip("gurobipy")
+
+# 9x9 example from main.py; small enough for a size-limited Gurobi license
+ROWS, COLS = 9, 9
+HOLES = [(2, 3), (6, 5)]
+REF_PATH = list(range(COLS)) + [j * COLS + COLS - 1 for j in range(1, ROWS)]
+OPTIMUM = 10 + 3 * 2 ** 0.5
+
+
+@pytest.fixture(scope = "module")
+def model():
+    return Model(ROWS, COLS, HOLES).warm()
+
+
+@pytest.mark.parametrize("method", ["solve", "solveflow", "solveMTZ", "solve_adaptive"])
+def test_cocycle_matches_harmonic(model, method):
+    harmonic = getattr(model, method)(REF_PATH, homology = "harmonic")
+    cocycle = getattr(model, method)(REF_PATH, homology = "cocycle")
+    assert harmonic is not None and cocycle is not None
+    assert cocycle[1] == pytest.approx(harmonic[1], abs = 1e-6)
+    assert harmonic[1] == pytest.approx(OPTIMUM, abs = 1e-6)
+
+
+# main.py's commented 9x9 path: the step (34, 43) runs through the dilated hole at (6, 5)
+OFF_GRID_PATH = [0, 1, 2, 3, 4, 5, 6, 7, 16, 25, 34, 43, 52, 61, 60, 59, 50, 41, 32, 23,
+                 22, 21, 20, 19, 28, 37, 47, 57, 67, 77, 78, 79, 80]
+
+
+@pytest.mark.parametrize("method", ["solve", "solveflow", "solveMTZ", "solve_adaptive"])
+def test_reference_path_off_grid_is_rejected(model, method):
+    with pytest.raises(ValueError, match = "not an edge"):
+        getattr(model, method)(OFF_GRID_PATH)
+
+
+def test_anytime_rejects_off_grid_path(model):
+    with pytest.raises(ValueError, match = "not an edge"):
+        next(model.iter_anytime(OFF_GRID_PATH, time_limit = 0.1))
+
+
+def test_anytime_reaches_optimum(model):
+    items = list(model.iter_anytime(REF_PATH, time_limit = 10.0))
+    assert items[0]["source"] == "reference"
+    assert [i["objective"] for i in items[:-1]] == sorted((i["objective"] for i in items[:-1]), reverse = True)
+    assert items[-1]["status"] == "optimal" and items[-1]["gap"] == pytest.approx(0.0, abs = 1e-6)
+    assert items[-1]["objective"] == pytest.approx(OPTIMUM, abs = 1e-6)
+
+
+def test_anytime_without_budget_returns_reference(model):
+    items = list(model.iter_anytime(REF_PATH, time_limit = 0.0))
+    assert [(i["source"], i["status"]) for i in items] == [("reference", "incumbent"), ("reference", "time_limit")]
+    assert items[-1]["elapsed"] < 0.5
+
+
+# Left column then across the middle: the cocycle rows once held on x alone, and solveflow could meet
+# them with x on a single crossing edge (15.24 instead of 20)
+DETOUR_PATH = [0, 9, 18, 27, 36, 45, 46, 47, 48, 49, 40, 31, 32, 33, 34, 35, 44, 53, 62, 71, 80]
+
+
+def test_solveflow_cocycle_rows_follow_the_flow(model):
+    harmonic = model.solveflow(DETOUR_PATH, homology = "harmonic")
+    cocycle = model.solveflow(DETOUR_PATH, homology = "cocycle")
+    assert harmonic[1] == pytest.approx(20.0, abs = 1e-6)
+    assert cocycle[1] == pytest.approx(harmonic[1], abs = 1e-6)
+
+
+def test_retracing_reference_path(model):
+    from homopath import HomologyCover
+
+    cover = HomologyCover(model.grid, 1)
+    _, pred = cover.shortest_paths(0, return_predecessors = True)
+    path = cover.path(pred, 0, 80, [0, -1])
+    assert len(set(path)) < len(path)
+
+    # The chain of the path is a unit s-t flow, as the cache key's winding assumes
+    chain = model._path_vector(path)
+    E = model.complex.edges
+    boundary = np.zeros(ROWS * COLS, dtype = int)
+    np.add.at(boundary, E[:, 1], chain)
+    np.add.at(boundary, E[:, 0], -chain)
+    assert np.flatnonzero(boundary).tolist() == [0, 80] and boundary[80] == 1
+
+    harmonic = model.solve(path, homology = "harmonic")
+    cocycle = model.solve(path, homology = "cocycle")
+    assert harmonic is not None and cocycle is not None
+    assert harmonic[1] == pytest.approx(cocycle[1], abs = 1e-6)
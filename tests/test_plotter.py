@@ -0,0 +1,15 @@
+import numpy as np
+import pytest
+
+from homopath import Plotter
+
+matplotlib = pytest.importorskip("matplotlib")
+matplotlib.use("Agg")
+
+
+@pytest.mark.parametrize("dilation", [0, 1, 2])
+def test_hole_lists_shade_the_blocked_cells(dilation):
+    plot = Plotter(19, 19, [(4, 4), (9, 9)], dilation = dilation)
+    ax = plot.plotfig([0, 1, 2])
+    assert len(ax.patches) == 2  # only the path arrows, no octagons
+    assert np.array_equal(ax.images[0].get_array(), plot.grid.blocked)
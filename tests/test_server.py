@@ -0,0 +1,92 @@
+import json
+import threading
+import urllib.error
+import urllib.request
+
+import pytest
+
+from homopath import make_server
+
+pytest.importorskip("gurobipy")
+
+ROWS, COLS = 9, 9
+HOLES = [[2, 3], [6, 5]]
+REF_PATH = list(range(COLS)) + [j * COLS + COLS - 1 for j in range(1, ROWS)]
+QUERY = {"rows": ROWS, "cols": COLS, "holes": HOLES, "path": REF_PATH}
+
+
+@pytest.fixture
+def serve():
+    """Start servers on free localhost ports; yields a factory returning (httpd, base URL)"""
+    servers = []
+
+    def start(**kwargs):
+        httpd = make_server(port = 0, **kwargs)
+        threading.Thread(target = httpd.serve_forever, daemon = True).start()
+        servers.append(httpd)
+        return httpd, f"http://127.0.0.1:{httpd.server_address[1]}"
+
+    yield start
+    for httpd in servers:
+        httpd.shutdown()
+        httpd.server_close()
+
+
+def post(url, body):
+    request = urllib.request.Request(url + "/plan", data = json.dumps(body).encode(), method = "POST")
+    try:
+        with urllib.request.urlopen(request, timeout = 60) as response:
+            return response.status, dict(response.headers), json.loads(response.read())
+    except urllib.error.HTTPError as exc:
+        return exc.code, dict(exc.headers), json.loads(exc.read())
+
+
+def get_stats(url):
+    with urllib.request.urlopen(url + "/stats", timeout = 60) as response:
+        return json.loads(response.read())
+
+
+def test_full_queue_returns_503(serve):
+    httpd, url = serve(workers = 0, max_queue = 1)
+    httpd.service.submit(QUERY)
+    status, headers, body = post(url, QUERY)
+    assert status == 503
+    assert headers["Retry-After"] == "1"
+    assert get_stats(url)["rejected"] == 1
+
+
+def test_concurrent_requests_build_the_map_once(serve):
+    _, url = serve(workers = 4, max_queue = 16)
+    methods = ["solve", "solveflow", "solveMTZ", "solve_adaptive"] * 2
+    results = []
+    threads = [threading.Thread(target = lambda m = m: results.append(post(url, dict(QUERY, method = m))))
+               for m in methods]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert [status for status, _, _ in results] == [200] * len(methods)
+    assert {round(body["objective"], 6) for _, _, body in results} == {round(10 + 3 * 2 ** 0.5, 6)}
+    stats = get_stats(url)
+    assert stats["map_builds"] == 1
+    assert stats["completed"] == len(methods)
+    latency = stats["latency"]
+    assert 0 < latency["p50"] <= latency["p90"] <= latency["p99"]
+
+
+def test_repeated_queries_reuse_the_built_model(serve):
+    httpd, _ = serve(workers = 0)
+    problems = {}
+    for path in (REF_PATH, REF_PATH[:-1]):
+        assert httpd.service.plan(dict(QUERY, path = path), problems = problems)["status"] == "optimal"
+    assert [p.solves for p in problems.values()] == [2]
+
+
+@pytest.mark.parametrize("body", [[1, 2], dict(QUERY, holes = [[20, 20]]), dict(QUERY, method = "nope"),
+                                  dict(QUERY, homology = "nope"), {"rows": ROWS}])
+def test_bad_queries_return_400(serve, body):
+    _, url = serve(workers = 1)
+    status, _, reply = post(url, body)
+    assert status == 400
+    assert "error" in reply